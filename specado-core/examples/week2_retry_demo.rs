@@ -199,7 +199,7 @@ async fn main() {
             println!("  Provider used: {}", result.provider_used);
             println!("  Total attempts: {}", result.attempts);
 
-            if let Some(retry_delay) = result.metadata.get("retry_delay_ms") {
+            if let Some(retry_delay) = result.metadata.retry_delay_ms {
                 println!("  Total retry delay: {}ms", retry_delay);
             }
         }
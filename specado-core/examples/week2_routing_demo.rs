@@ -86,14 +86,14 @@ async fn main() {
             // Show detailed metadata
             if result.used_fallback {
                 println!("\n📊 Fallback Metadata:");
-                if let Some(primary) = result.metadata.get("primary_provider") {
+                if let Some(primary) = &result.metadata.primary_provider {
                     println!("  Primary provider: {}", primary);
                 }
-                if let Some(fallback) = result.metadata.get("fallback_provider") {
+                if let Some(fallback) = &result.metadata.fallback_provider {
                     println!("  Fallback provider: {}", fallback);
                 }
-                if let Some(errors) = result.metadata.get("provider_errors") {
-                    println!("  Provider errors: {}", errors);
+                if let Some(errors) = &result.metadata.provider_errors {
+                    println!("  Provider errors: {:?}", errors);
                 }
             }
         }
@@ -185,7 +185,7 @@ async fn main() {
             }
 
             println!("\n📊 Full Routing Metadata:");
-            for (key, value) in &result.metadata {
+            for (key, value) in result.metadata.entries() {
                 println!("  {}: {}", key, value);
             }
         }
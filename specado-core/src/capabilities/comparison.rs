@@ -102,6 +102,146 @@ pub enum LossinessImpact {
     Major,
 }
 
+/// Boolean capability flags packed into bitmasks
+///
+/// Bits are assigned in the order the comparison reports them, so walking
+/// set bits from lowest to highest yields a stable, readable order.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct CapBits {
+    /// Model feature flags (see `FEATURE_BITS`)
+    pub features: u64,
+
+    /// Supported roles (see `ROLE_BITS`)
+    pub roles: u64,
+
+    /// Supported control parameters (see `PARAM_BITS`)
+    pub params_supported: u64,
+}
+
+/// Feature bit assignment
+pub const FEATURE_BITS: [&str; 9] = [
+    "function_calling",
+    "json_mode",
+    "streaming",
+    "vision",
+    "tool_use",
+    "logprobs",
+    "multiple_responses",
+    "stop_sequences",
+    "seed_support",
+];
+
+/// Role bit assignment
+pub const ROLE_BITS: [&str; 5] = ["system", "user", "assistant", "function", "tool"];
+
+/// Parameter bit assignment
+pub const PARAM_BITS: [&str; 7] = [
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "frequency_penalty",
+    "presence_penalty",
+    "repetition_penalty",
+];
+
+const FUNCTION_CALLING: u64 = 1 << 0;
+const TOOL_USE: u64 = 1 << 4;
+
+/// Features whose absence in the target is reported as lossy
+const COMPARED_FEATURES: u64 = 0b1_1111;
+
+/// Roles whose absence in the target is reported as lossy (system, function)
+const COMPARED_ROLES: u64 = 0b0_1001;
+
+/// Parameters whose absence in the target is reported as lossy (temperature)
+const COMPARED_PARAMS: u64 = 0b000_0001;
+
+/// Human-readable details for the compared features, indexed by bit
+const FEATURE_DETAILS: [&str; 5] = [
+    "Target provider does not support function calling",
+    "Target provider does not support JSON mode for structured output",
+    "Target provider does not support streaming responses",
+    "Target provider does not support vision/image analysis",
+    "Target provider does not support tool use or function calling",
+];
+
+/// Human-readable details for the compared roles, indexed by bit
+const ROLE_DETAILS: [&str; 5] = [
+    "Target does not support system role for instructions",
+    "",
+    "",
+    "Target does not support function role for function results",
+    "",
+];
+
+impl CapBits {
+    /// Pack the boolean flags of a capability into bitmasks
+    pub fn from_capability(cap: &Capability) -> Self {
+        let f = &cap.features;
+        let features = [
+            f.function_calling,
+            f.json_mode,
+            f.streaming,
+            f.vision,
+            f.tool_use,
+            f.logprobs,
+            f.multiple_responses,
+            f.stop_sequences,
+            f.seed_support,
+        ];
+
+        let r = &cap.roles;
+        let roles = [r.system, r.user, r.assistant, r.function, r.tool];
+
+        let p = &cap.parameters;
+        let params = [
+            p.temperature.supported,
+            p.top_p.supported,
+            p.top_k.supported,
+            p.max_tokens.supported,
+            p.frequency_penalty.supported,
+            p.presence_penalty.supported,
+            p.repetition_penalty.supported,
+        ];
+
+        Self {
+            features: pack(&features),
+            roles: pack(&roles),
+            params_supported: pack(&params),
+        }
+    }
+
+    /// Flags set in `self` but not in `other`
+    pub fn missing_in(&self, other: &CapBits) -> CapBits {
+        CapBits {
+            features: self.features & !other.features,
+            roles: self.roles & !other.roles,
+            params_supported: self.params_supported & !other.params_supported,
+        }
+    }
+}
+
+/// Pack a slice of flags into a bitmask, first flag in bit 0
+fn pack(flags: &[bool]) -> u64 {
+    flags
+        .iter()
+        .enumerate()
+        .fold(0, |bits, (i, &set)| bits | ((set as u64) << i))
+}
+
+/// Iterate the indices of set bits, lowest first
+fn set_bits(mut bits: u64) -> impl Iterator<Item = usize> {
+    std::iter::from_fn(move || {
+        if bits == 0 {
+            return None;
+        }
+        let bit = bits.trailing_zeros() as usize;
+        bits &= bits - 1;
+        Some(bit)
+    })
+}
+
 impl CapabilityComparison {
     /// Compare source capabilities against target capabilities
     pub fn compare(source: &Capability, target: &Capability) -> Self {
@@ -112,10 +252,14 @@ impl CapabilityComparison {
         let mut details = Vec::new();
         let mut recommendations = Vec::new();
 
+        let source_bits = CapBits::from_capability(source);
+        let target_bits = CapBits::from_capability(target);
+        let lost = source_bits.missing_in(&target_bits);
+
         // Check model features
         Self::compare_features(
-            source,
-            target,
+            lost.features,
+            target_bits.features,
             &mut missing_capabilities,
             &mut lossiness_types,
             &mut details,
@@ -134,6 +278,7 @@ impl CapabilityComparison {
         Self::compare_parameters(
             source,
             target,
+            lost.params_supported,
             &mut constrained_capabilities,
             &mut lossiness_types,
             &mut details,
@@ -141,8 +286,7 @@ impl CapabilityComparison {
 
         // Check roles
         Self::compare_roles(
-            source,
-            target,
+            lost.roles,
             &mut missing_capabilities,
             &mut lossiness_types,
             &mut details,
@@ -179,48 +323,24 @@ impl CapabilityComparison {
     }
 
     fn compare_features(
-        source: &Capability,
-        target: &Capability,
+        lost: u64,
+        target_features: u64,
         missing: &mut Vec<String>,
         lossiness: &mut Vec<LossinessType>,
         details: &mut Vec<String>,
     ) {
-        if source.features.function_calling && !target.features.function_calling {
-            missing.push("function_calling".to_string());
-            lossiness.push(LossinessType::MissingFeature(
-                "function_calling".to_string(),
-            ));
-            details.push("Target provider does not support function calling".to_string());
-        }
-
-        if source.features.json_mode && !target.features.json_mode {
-            missing.push("json_mode".to_string());
-            lossiness.push(LossinessType::MissingFeature("json_mode".to_string()));
-            details.push(
-                "Target provider does not support JSON mode for structured output".to_string(),
-            );
-        }
+        let mut lost = lost & COMPARED_FEATURES;
 
-        if source.features.streaming && !target.features.streaming {
-            missing.push("streaming".to_string());
-            lossiness.push(LossinessType::MissingFeature("streaming".to_string()));
-            details.push("Target provider does not support streaming responses".to_string());
+        // Tool use can be mapped onto function calling when the target has it
+        if target_features & FUNCTION_CALLING != 0 {
+            lost &= !TOOL_USE;
         }
 
-        if source.features.vision && !target.features.vision {
-            missing.push("vision".to_string());
-            lossiness.push(LossinessType::MissingFeature("vision".to_string()));
-            details.push("Target provider does not support vision/image analysis".to_string());
-        }
-
-        if source.features.tool_use && !target.features.tool_use {
-            if !target.features.function_calling {
-                missing.push("tool_use".to_string());
-                lossiness.push(LossinessType::MissingFeature("tool_use".to_string()));
-                details.push(
-                    "Target provider does not support tool use or function calling".to_string(),
-                );
-            }
+        for bit in set_bits(lost) {
+            let name = FEATURE_BITS[bit];
+            missing.push(name.to_string());
+            lossiness.push(LossinessType::MissingFeature(name.to_string()));
+            details.push(FEATURE_DETAILS[bit].to_string());
         }
     }
 
@@ -253,16 +373,16 @@ impl CapabilityComparison {
     fn compare_parameters(
         source: &Capability,
         target: &Capability,
+        lost_params: u64,
         constrained: &mut Vec<ConstraintDifference>,
         lossiness: &mut Vec<LossinessType>,
         details: &mut Vec<String>,
     ) {
-        // Check temperature support
-        if source.parameters.temperature.supported && !target.parameters.temperature.supported {
-            lossiness.push(LossinessType::ConstrainedParameter(
-                "temperature".to_string(),
-            ));
-            details.push("Target does not support temperature parameter".to_string());
+        // Check support for individual parameters
+        for bit in set_bits(lost_params & COMPARED_PARAMS) {
+            let name = PARAM_BITS[bit];
+            lossiness.push(LossinessType::ConstrainedParameter(name.to_string()));
+            details.push(format!("Target does not support {} parameter", name));
         }
 
         // Check max_tokens
@@ -289,22 +409,16 @@ impl CapabilityComparison {
     }
 
     fn compare_roles(
-        source: &Capability,
-        target: &Capability,
+        lost_roles: u64,
         missing: &mut Vec<String>,
         lossiness: &mut Vec<LossinessType>,
         details: &mut Vec<String>,
     ) {
-        if source.roles.system && !target.roles.system {
-            missing.push("system_role".to_string());
-            lossiness.push(LossinessType::MissingRole("system".to_string()));
-            details.push("Target does not support system role for instructions".to_string());
-        }
-
-        if source.roles.function && !target.roles.function {
-            missing.push("function_role".to_string());
-            lossiness.push(LossinessType::MissingRole("function".to_string()));
-            details.push("Target does not support function role for function results".to_string());
+        for bit in set_bits(lost_roles & COMPARED_ROLES) {
+            let name = ROLE_BITS[bit];
+            missing.push(format!("{}_role", name));
+            lossiness.push(LossinessType::MissingRole(name.to_string()));
+            details.push(ROLE_DETAILS[bit].to_string());
         }
     }
 
@@ -457,6 +571,55 @@ mod tests {
         assert!(comparison.lossiness_report.severity >= LossinessSeverity::Medium);
     }
 
+    #[test]
+    fn test_cap_bits_packing() {
+        let mut cap = Capability::default();
+        cap.features.function_calling = true;
+        cap.features.vision = true;
+
+        let bits = CapBits::from_capability(&cap);
+        assert_eq!(bits.features, 0b1001);
+
+        let empty = CapBits::default();
+        assert_eq!(bits.missing_in(&empty).features, 0b1001);
+        assert_eq!(empty.missing_in(&bits).features, 0);
+    }
+
+    #[test]
+    fn test_tool_use_covered_by_function_calling() {
+        let mut source = Capability::default();
+        source.features.tool_use = true;
+
+        let mut target = Capability::default();
+        target.features.function_calling = true;
+
+        let comparison = CapabilityComparison::compare(&source, &target);
+        assert!(!comparison
+            .missing_capabilities
+            .contains(&"tool_use".to_string()));
+
+        target.features.function_calling = false;
+        let comparison = CapabilityComparison::compare(&source, &target);
+        assert!(comparison
+            .missing_capabilities
+            .contains(&"tool_use".to_string()));
+    }
+
+    #[test]
+    fn test_missing_role_lossiness() {
+        let mut source = Capability::default();
+        source.roles.system = true;
+        source.roles.function = true;
+
+        let target = Capability::default();
+
+        let comparison = CapabilityComparison::compare(&source, &target);
+        assert_eq!(
+            comparison.missing_capabilities,
+            vec!["system_role".to_string(), "function_role".to_string()]
+        );
+    }
+
     #[test]
     fn test_constraint_lossiness() {
         let mut source = Capability::default();
@@ -13,7 +13,7 @@ pub mod ffi;
 pub mod modality;
 pub mod provider_manifest;
 
-pub use comparison::{CapabilityComparison, LossinessReport, LossinessType};
+pub use comparison::{CapBits, CapabilityComparison, LossinessReport, LossinessType};
 pub use constraints::{Constraints, RateLimits, TokenLimits};
 pub use modality::{Modality, ModalitySupport};
 pub use provider_manifest::{ProviderInfo, ProviderManifest};
@@ -0,0 +1,91 @@
+//! Reusable buffers for reading response bodies
+//!
+//! Each thread keeps one spare body buffer. A request takes it, fills it with
+//! the response, and hands it back when dropped, so consecutive requests (and
+//! retry attempts) reuse the same allocation. The buffer is owned while in use,
+//! so it is safe to hold across `.await` points even if the task moves threads.
+
+use std::cell::Cell;
+use std::ops::{Deref, DerefMut};
+
+/// Capacity reserved the first time a thread needs a buffer
+const INITIAL_CAPACITY: usize = 16 * 1024;
+
+/// Buffers that grew beyond this are freed instead of kept for reuse
+const MAX_RETAINED_CAPACITY: usize = 1024 * 1024;
+
+thread_local! {
+    static BODY_BUF: Cell<Vec<u8>> = const { Cell::new(Vec::new()) };
+}
+
+/// A body buffer borrowed from the current thread's pool
+#[derive(Debug)]
+pub struct PooledBuffer {
+    buf: Vec<u8>,
+}
+
+impl PooledBuffer {
+    /// Take the thread's spare buffer (or allocate one), emptied
+    pub fn take() -> Self {
+        let mut buf = BODY_BUF.try_with(Cell::take).unwrap_or_default();
+        buf.clear();
+        if buf.capacity() == 0 {
+            buf.reserve(INITIAL_CAPACITY);
+        }
+        Self { buf }
+    }
+}
+
+impl Deref for PooledBuffer {
+    type Target = Vec<u8>;
+
+    fn deref(&self) -> &Vec<u8> {
+        &self.buf
+    }
+}
+
+impl DerefMut for PooledBuffer {
+    fn deref_mut(&mut self) -> &mut Vec<u8> {
+        &mut self.buf
+    }
+}
+
+impl Drop for PooledBuffer {
+    fn drop(&mut self) {
+        if self.buf.capacity() <= MAX_RETAINED_CAPACITY {
+            let buf = std::mem::take(&mut self.buf);
+            // Ignore failures during thread teardown
+            let _ = BODY_BUF.try_with(|slot| slot.set(buf));
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_buffer_reused_on_same_thread() {
+        let ptr = {
+            let mut buf = PooledBuffer::take();
+            buf.extend_from_slice(b"{\"id\": 1}");
+            buf.as_ptr()
+        };
+
+        let buf = PooledBuffer::take();
+        assert!(buf.is_empty());
+        assert!(buf.capacity() >= INITIAL_CAPACITY);
+        assert_eq!(buf.as_ptr(), ptr);
+    }
+
+    #[test]
+    fn test_oversized_buffer_not_retained() {
+        {
+            let mut buf = PooledBuffer::take();
+            buf.reserve(MAX_RETAINED_CAPACITY * 2);
+        }
+
+        let buf = PooledBuffer::take();
+        assert!(buf.capacity() <= MAX_RETAINED_CAPACITY);
+    }
+}
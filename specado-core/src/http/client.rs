@@ -1,5 +1,6 @@
 //! HTTP client implementation using reqwest
 
+use crate::http::buffer::PooledBuffer;
 use crate::http::{CallKind, HttpExecutor, RequestOptions, StreamDelta};
 use crate::protocol::types::{ChatRequest, ChatResponse};
 use crate::providers::adapter::Provider;
@@ -7,8 +8,8 @@ use crate::providers::routing::ProviderError;
 use async_trait::async_trait;
 use reqwest::{Client, ClientBuilder, Response};
 use serde_json::Value;
-use std::sync::Arc;
-use std::time::Duration;
+use std::sync::{Arc, OnceLock};
+use std::time::{Duration, Instant};
 use tracing::{debug, error, info, warn};
 
 /// Maximum response size (10MB for MVP)
@@ -27,16 +28,24 @@ pub struct HttpClient {
     max_response_size: usize,
 }
 
+/// Process-wide reqwest client so every router shares one connection pool
+static SHARED_CLIENT: OnceLock<Arc<Client>> = OnceLock::new();
+
 impl HttpClient {
-    /// Create a new HTTP client with default settings
-    pub fn new() -> Result<Self, String> {
-        let client = ClientBuilder::new()
+    /// Builder with the default pool and timeout settings
+    fn default_builder() -> ClientBuilder {
+        ClientBuilder::new()
             .pool_max_idle_per_host(10)
             .pool_idle_timeout(Duration::from_secs(90))
             .connect_timeout(Duration::from_secs(10))
             .timeout(Duration::from_secs(30))
             .user_agent(USER_AGENT)
             .gzip(true)
+    }
+
+    /// Create a new HTTP client with default settings
+    pub fn new() -> Result<Self, String> {
+        let client = Self::default_builder()
             .build()
             .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
 
@@ -46,6 +55,30 @@ impl HttpClient {
         })
     }
 
+    /// Get a handle to the process-wide HTTP client
+    ///
+    /// All handles share a single connection pool, so keep-alive connections
+    /// and TLS sessions are reused across routers and client instances.
+    /// Pooled connections are driven by the tokio runtime that opened them,
+    /// so only use this when all requests run on one long-lived runtime;
+    /// `RoutingStrategy` implementations default to `HttpClient::new()`.
+    pub fn shared() -> Result<Self, String> {
+        let client = match SHARED_CLIENT.get() {
+            Some(client) => client.clone(),
+            None => {
+                let client = Self::default_builder()
+                    .build()
+                    .map_err(|e| format!("Failed to create HTTP client: {}", e))?;
+                SHARED_CLIENT.get_or_init(|| Arc::new(client)).clone()
+            }
+        };
+
+        Ok(Self {
+            client,
+            max_response_size: MAX_RESPONSE_SIZE,
+        })
+    }
+
     /// Create a new HTTP client with custom configuration
     pub fn with_config(
         connect_timeout: Duration,
@@ -68,6 +101,25 @@ impl HttpClient {
         })
     }
 
+    /// Open a pooled connection to a provider ahead of the first request
+    ///
+    /// Sends a HEAD request to the provider's base URL and discards the
+    /// response; the TCP and TLS handshakes stay in the idle pool for the
+    /// next real request. Returns the time the round-trip took.
+    pub async fn prewarm(&self, provider: &dyn Provider) -> Result<Duration, ProviderError> {
+        let started = Instant::now();
+        self.client
+            .head(provider.base_url())
+            .send()
+            .await
+            .map_err(|e| ProviderError::NetworkError {
+                message: format!("Prewarm of {} failed: {}", provider.name(), e),
+            })?;
+
+        debug!("Prewarmed connection to {}", provider.name());
+        Ok(started.elapsed())
+    }
+
     /// Build the full URL for a provider and call kind
     fn build_url(&self, provider: &dyn Provider, call_kind: CallKind) -> String {
         format!("{}{}", provider.base_url(), provider.endpoint(call_kind))
@@ -176,7 +228,7 @@ impl HttpExecutor for HttpClient {
         }
 
         // Execute request
-        let response = req_builder.send().await.map_err(|e| {
+        let mut response = req_builder.send().await.map_err(|e| {
             if e.is_timeout() {
                 warn!(
                     "Request timeout for {} [request_id: {}]",
@@ -239,32 +291,42 @@ impl HttpExecutor for HttpClient {
         // Check content length
         self.check_content_length(&response)?;
 
-        // Parse response body
-        let response_text = response
-            .text()
-            .await
-            .map_err(|e| ProviderError::NetworkError {
-                message: format!(
-                    "Failed to read response body: {} [request_id: {}]",
-                    e, request_id
-                ),
-            })?;
-
-        // Check response size after reading
-        if response_text.len() > self.max_response_size {
-            return Err(ProviderError::Custom {
-                code: "RESPONSE_TOO_LARGE".to_string(),
-                message: format!(
-                    "Response size {} exceeds maximum {} [request_id: {}]",
-                    response_text.len(),
-                    self.max_response_size,
+        // Read response body into this thread's reusable buffer, enforcing
+        // the size limit as chunks arrive
+        let mut body = PooledBuffer::take();
+        while let Some(chunk) = response.chunk().await.map_err(|e| {
+            if e.is_timeout() {
+                warn!(
+                    "Response body timeout for {} [request_id: {}]",
+                    provider.name(),
                     request_id
-                ),
-            });
+                );
+                ProviderError::Timeout
+            } else {
+                ProviderError::NetworkError {
+                    message: format!(
+                        "Failed to read response body: {} [request_id: {}]",
+                        e, request_id
+                    ),
+                }
+            }
+        })? {
+            if body.len() + chunk.len() > self.max_response_size {
+                return Err(ProviderError::Custom {
+                    code: "RESPONSE_TOO_LARGE".to_string(),
+                    message: format!(
+                        "Response size {} exceeds maximum {} [request_id: {}]",
+                        body.len() + chunk.len(),
+                        self.max_response_size,
+                        request_id
+                    ),
+                });
+            }
+            body.extend_from_slice(&chunk);
         }
 
         // Parse JSON response as generic Value first
-        let response_json: Value = serde_json::from_str(&response_text).map_err(|e| {
+        let response_json: Value = crate::http::json::from_slice(&mut body).map_err(|e| {
             error!(
                 "Failed to parse JSON from {} [request_id: {}]: {}",
                 provider.name(),
@@ -337,3 +399,18 @@ impl Default for HttpClient {
         Self::new().expect("Failed to create default HTTP client")
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_shared_client_reuses_pool() {
+        let a = HttpClient::shared().unwrap();
+        let b = HttpClient::shared().unwrap();
+        assert!(Arc::ptr_eq(&a.client, &b.client));
+
+        let fresh = HttpClient::new().unwrap();
+        assert!(!Arc::ptr_eq(&a.client, &fresh.client));
+    }
+}
@@ -0,0 +1,56 @@
+//! JSON decoding for provider responses
+//!
+//! Response bodies are decoded with `serde_json` by default. Building with the
+//! `simd-json` feature switches to SIMD-accelerated parsing (with runtime CPU
+//! detection); the output is the same `serde_json::Value`, so callers do not
+//! change.
+
+use serde::de::DeserializeOwned;
+use thiserror::Error;
+
+/// Error returned when a body is not valid JSON
+#[derive(Debug, Error)]
+#[error("{0}")]
+pub struct JsonError(String);
+
+/// Decode a JSON body
+///
+/// Takes the buffer mutably because the SIMD parser decodes in place; the
+/// contents of `bytes` are unspecified afterwards.
+#[cfg(feature = "simd-json")]
+pub fn from_slice<T: DeserializeOwned>(bytes: &mut [u8]) -> Result<T, JsonError> {
+    simd_json::serde::from_slice(bytes).map_err(|e| JsonError(e.to_string()))
+}
+
+/// Decode a JSON body
+///
+/// Takes the buffer mutably to match the `simd-json` feature, which decodes in
+/// place; this implementation leaves it untouched.
+#[cfg(not(feature = "simd-json"))]
+pub fn from_slice<T: DeserializeOwned>(bytes: &mut [u8]) -> Result<T, JsonError> {
+    serde_json::from_slice(bytes).map_err(|e| JsonError(e.to_string()))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::{json, Value};
+
+    #[test]
+    fn test_from_slice_decodes_value() {
+        let mut body = r#"{"id": "chatcmpl-1", "choices": [{"index": 0, "text": "hi é"}]}"#
+            .as_bytes()
+            .to_vec();
+        let value: Value = from_slice(&mut body).unwrap();
+        assert_eq!(
+            value,
+            json!({"id": "chatcmpl-1", "choices": [{"index": 0, "text": "hi é"}]})
+        );
+    }
+
+    #[test]
+    fn test_from_slice_rejects_invalid_json() {
+        let mut body = b"{\"id\": ".to_vec();
+        assert!(from_slice::<Value>(&mut body).is_err());
+    }
+}
@@ -6,8 +6,10 @@
 //! - Error mapping and retry hints
 //! - Request ID generation and correlation
 
+pub mod buffer;
 pub mod client;
 pub mod error;
+pub mod json;
 
 use crate::protocol::types::{ChatRequest, ChatResponse};
 use crate::providers::adapter::Provider;
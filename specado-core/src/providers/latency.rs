@@ -0,0 +1,244 @@
+//! Adaptive request timeouts driven by observed provider latency
+//!
+//! This module tracks an exponentially weighted moving average (EWMA) of
+//! response latency per provider and model, and derives request timeouts from
+//! it instead of using a single fixed value for every provider. A timed-out
+//! request counts as a sample beyond the timeout that was applied, so a
+//! provider that slows down widens its own timeout instead of timing out
+//! repeatedly.
+
+use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::sync::Mutex;
+use std::time::Duration;
+
+/// Weight given to each new latency sample
+const EWMA_ALPHA: f64 = 0.1;
+
+/// Number of standard deviations above the mean used as the timeout (~p99)
+const DEVIATION_FACTOR: f64 = 3.0;
+
+/// Samples required before the adaptive timeout replaces the maximum
+const MIN_SAMPLES: u64 = 5;
+
+/// A timed-out request is counted as a sample at this multiple of its timeout
+const TIMEOUT_SAMPLE_FACTOR: f64 = 2.0;
+
+/// Default lower bound for computed timeouts
+pub const DEFAULT_MIN_TIMEOUT: Duration = Duration::from_secs(15);
+
+/// Default upper bound for computed timeouts
+pub const DEFAULT_MAX_TIMEOUT: Duration = Duration::from_secs(30);
+
+/// Latency statistics for a single provider and model
+#[derive(Debug, Clone, Default, PartialEq, Serialize, Deserialize)]
+pub struct LatencyStats {
+    /// Moving average of request latency (milliseconds)
+    pub ewma_ms: f64,
+
+    /// Moving variance of request latency (milliseconds squared)
+    pub ewma_var_ms: f64,
+
+    /// Number of successful requests observed
+    pub count: u64,
+
+    /// Number of requests that timed out
+    pub timeouts: u64,
+}
+
+impl LatencyStats {
+    /// Fold a latency sample into the moving statistics
+    fn record(&mut self, sample_ms: f64) {
+        if self.count == 0 && self.timeouts == 0 {
+            self.ewma_ms = sample_ms;
+            self.ewma_var_ms = 0.0;
+        } else {
+            let diff = sample_ms - self.ewma_ms;
+            self.ewma_ms += EWMA_ALPHA * diff;
+            self.ewma_var_ms = (1.0 - EWMA_ALPHA) * (self.ewma_var_ms + EWMA_ALPHA * diff * diff);
+        }
+    }
+
+    /// Estimated high-percentile latency (mean plus three deviations)
+    pub fn p99_estimate_ms(&self) -> f64 {
+        self.ewma_ms + DEVIATION_FACTOR * self.ewma_var_ms.sqrt()
+    }
+}
+
+/// Tracks latency per provider and model and computes request timeouts
+#[derive(Debug)]
+pub struct LatencyTracker {
+    /// Statistics keyed by (provider, model)
+    stats: Mutex<HashMap<(String, String), LatencyStats>>,
+
+    /// Lower bound for computed timeouts
+    min_timeout: Duration,
+
+    /// Upper bound for computed timeouts, also used until enough samples exist
+    max_timeout: Duration,
+}
+
+impl LatencyTracker {
+    /// Create a tracker with default bounds (15s to 30s)
+    pub fn new() -> Self {
+        Self::with_bounds(DEFAULT_MIN_TIMEOUT, DEFAULT_MAX_TIMEOUT)
+    }
+
+    /// Create a tracker with custom timeout bounds
+    pub fn with_bounds(min_timeout: Duration, max_timeout: Duration) -> Self {
+        Self {
+            stats: Mutex::new(HashMap::new()),
+            min_timeout,
+            max_timeout: max_timeout.max(min_timeout),
+        }
+    }
+
+    /// Get the timeout to use for the next request to this provider and model
+    pub fn timeout_for(&self, provider: &str, model: &str) -> Duration {
+        let stats = self.stats.lock().unwrap_or_else(|e| e.into_inner());
+        match stats.get(&(provider.to_string(), model.to_string())) {
+            Some(entry) if entry.count >= MIN_SAMPLES => {
+                let timeout = Duration::from_millis(entry.p99_estimate_ms().ceil() as u64);
+                timeout.clamp(self.min_timeout, self.max_timeout)
+            }
+            _ => self.max_timeout,
+        }
+    }
+
+    /// Record the latency of a successful request
+    pub fn record_success(&self, provider: &str, model: &str, elapsed: Duration) {
+        let mut stats = self.stats.lock().unwrap_or_else(|e| e.into_inner());
+        let entry = stats
+            .entry((provider.to_string(), model.to_string()))
+            .or_default();
+        entry.record(elapsed.as_secs_f64() * 1000.0);
+        entry.count += 1;
+    }
+
+    /// Record a request that timed out after `timeout`
+    ///
+    /// The true latency is unknown but at least `timeout`, so it is folded in
+    /// as a sample at a multiple of it. This raises both the average and the
+    /// deviation, which widens the next timeout for this provider and model.
+    pub fn record_timeout(&self, provider: &str, model: &str, timeout: Duration) {
+        let mut stats = self.stats.lock().unwrap_or_else(|e| e.into_inner());
+        let entry = stats
+            .entry((provider.to_string(), model.to_string()))
+            .or_default();
+        entry.record(timeout.as_secs_f64() * 1000.0 * TIMEOUT_SAMPLE_FACTOR);
+        entry.timeouts += 1;
+    }
+
+    /// Snapshot of all statistics keyed by `"provider/model"`
+    pub fn snapshot(&self) -> HashMap<String, LatencyStats> {
+        let stats = self.stats.lock().unwrap_or_else(|e| e.into_inner());
+        stats
+            .iter()
+            .map(|((provider, model), entry)| (format!("{}/{}", provider, model), entry.clone()))
+            .collect()
+    }
+}
+
+impl Default for LatencyTracker {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_uses_max_timeout_until_warmed_up() {
+        let tracker = LatencyTracker::new();
+        assert_eq!(
+            tracker.timeout_for("openai", "gpt-4"),
+            Duration::from_secs(30)
+        );
+
+        for _ in 0..MIN_SAMPLES - 1 {
+            tracker.record_success("openai", "gpt-4", Duration::from_millis(200));
+        }
+        assert_eq!(
+            tracker.timeout_for("openai", "gpt-4"),
+            Duration::from_secs(30)
+        );
+    }
+
+    #[test]
+    fn test_timeout_clamped_to_bounds() {
+        let tracker =
+            LatencyTracker::with_bounds(Duration::from_millis(500), Duration::from_secs(10));
+
+        for _ in 0..10 {
+            tracker.record_success("openai", "gpt-4", Duration::from_millis(100));
+        }
+        assert_eq!(
+            tracker.timeout_for("openai", "gpt-4"),
+            Duration::from_millis(500)
+        );
+
+        for _ in 0..10 {
+            tracker.record_success("anthropic", "claude", Duration::from_secs(20));
+        }
+        assert_eq!(
+            tracker.timeout_for("anthropic", "claude"),
+            Duration::from_secs(10)
+        );
+    }
+
+    #[test]
+    fn test_timeout_tracks_latency() {
+        let tracker =
+            LatencyTracker::with_bounds(Duration::from_millis(1), Duration::from_secs(60));
+
+        for sample in [1000, 1200, 800, 1100, 900, 1000] {
+            tracker.record_success("openai", "gpt-4", Duration::from_millis(sample));
+        }
+
+        let timeout = tracker.timeout_for("openai", "gpt-4");
+        assert!(timeout > Duration::from_millis(1000));
+        assert!(timeout < Duration::from_secs(2));
+    }
+
+    #[test]
+    fn test_default_floor() {
+        let tracker = LatencyTracker::new();
+        for _ in 0..10 {
+            tracker.record_success("openai", "gpt-4", Duration::from_millis(100));
+        }
+        assert_eq!(tracker.timeout_for("openai", "gpt-4"), DEFAULT_MIN_TIMEOUT);
+    }
+
+    #[test]
+    fn test_timeouts_widen_timeout() {
+        let tracker =
+            LatencyTracker::with_bounds(Duration::from_millis(500), Duration::from_secs(10));
+        for _ in 0..10 {
+            tracker.record_success("openai", "gpt-4", Duration::from_millis(100));
+        }
+
+        let mut timeout = tracker.timeout_for("openai", "gpt-4");
+        assert_eq!(timeout, Duration::from_millis(500));
+        for _ in 0..3 {
+            tracker.record_timeout("openai", "gpt-4", timeout);
+            let widened = tracker.timeout_for("openai", "gpt-4");
+            assert!(widened > timeout);
+            timeout = widened;
+        }
+    }
+
+    #[test]
+    fn test_snapshot_counts_timeouts() {
+        let tracker = LatencyTracker::new();
+        tracker.record_success("openai", "gpt-4", Duration::from_millis(300));
+        tracker.record_timeout("openai", "gpt-4", Duration::from_secs(30));
+
+        let snapshot = tracker.snapshot();
+        let entry = &snapshot["openai/gpt-4"];
+        assert_eq!(entry.timeouts, 1);
+        assert_eq!(entry.count, 1);
+        assert!(entry.ewma_ms > 300.0);
+    }
+}
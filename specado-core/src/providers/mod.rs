@@ -7,6 +7,7 @@
 pub mod adapter;
 pub mod anthropic;
 pub mod json_transform;
+pub mod latency;
 pub mod openai;
 pub mod retry;
 pub mod routing;
@@ -21,8 +22,12 @@ pub use openai::OpenAIProvider;
 
 // Re-export routing types
 pub use routing::{
-    PrimaryWithFallbacks, ProviderError, RoutingBuilder, RoutingResult, RoutingStrategy,
+    PrimaryWithFallbacks, ProviderError, RoutingBuilder, RoutingMetadata, RoutingResult,
+    RoutingStrategy,
 };
 
+// Re-export latency tracking types
+pub use latency::{LatencyStats, LatencyTracker, DEFAULT_MAX_TIMEOUT, DEFAULT_MIN_TIMEOUT};
+
 // Re-export retry types
 pub use retry::{ErrorMapper, RetryExecutor, RetryPolicy, RetryResult};
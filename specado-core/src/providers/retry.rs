@@ -91,11 +91,19 @@ impl RetryPolicy {
     }
 
     /// Calculate the delay for a given retry attempt
+    ///
+    /// Uses truncated exponential backoff with jitter. Only an explicit
+    /// retry-after from the provider overrides the schedule; the fixed
+    /// per-error hints from `ProviderError::retry_delay` are not used here
+    /// so that the first retry fires quickly and later ones spread out.
     pub fn calculate_delay(&self, attempt: u32, error: &ProviderError) -> Duration {
         // Check for retry-after header first
         if self.respect_retry_after {
-            if let Some(retry_after) = error.retry_delay() {
-                return retry_after;
+            if let ProviderError::RateLimit {
+                retry_after: Some(retry_after),
+            } = error
+            {
+                return *retry_after;
             }
         }
 
@@ -409,6 +417,24 @@ mod tests {
         assert_eq!(delay.as_secs(), 5);
     }
 
+    #[test]
+    fn test_backoff_ignores_fixed_error_hints() {
+        let policy = RetryPolicy {
+            jitter_factor: 0.0,
+            ..Default::default()
+        };
+
+        let error = ProviderError::ServerError {
+            status_code: 503,
+            message: "unavailable".to_string(),
+        };
+
+        // Exponential schedule, not the fixed 2s server-error hint
+        assert_eq!(policy.calculate_delay(0, &error).as_millis(), 100);
+        assert_eq!(policy.calculate_delay(1, &error).as_millis(), 200);
+        assert_eq!(policy.calculate_delay(2, &error).as_millis(), 400);
+    }
+
     #[test]
     fn test_should_retry_logic() {
         let policy = RetryPolicy::new(2);
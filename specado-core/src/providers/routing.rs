@@ -5,13 +5,15 @@
 
 use crate::protocol::types::{ChatRequest, ChatResponse};
 use crate::providers::adapter::Provider;
+use crate::providers::latency::LatencyTracker;
 use crate::providers::transform::TransformResult;
 use async_trait::async_trait;
 use serde::{Deserialize, Serialize};
 use serde_json::{json, Value};
 use std::collections::HashMap;
 use std::fmt;
-use std::time::Duration;
+use std::sync::Arc;
+use std::time::{Duration, Instant};
 
 /// Errors that can occur during provider operations
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -118,7 +120,109 @@ pub struct RoutingResult {
     pub provider_errors: HashMap<String, String>,
 
     /// Additional routing metadata
-    pub metadata: HashMap<String, Value>,
+    pub metadata: RoutingMetadata,
+}
+
+/// Routing metadata recorded for a request
+///
+/// Fields are `None` when not recorded, either because they do not apply
+/// (e.g. `fallback_provider` when the primary succeeded) or because metadata
+/// tracking is disabled.
+#[derive(Debug, Clone, Default, PartialEq, Serialize, Deserialize)]
+#[serde(default)]
+pub struct RoutingMetadata {
+    /// Provider tried first
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub primary_provider: Option<String>,
+
+    /// Fallback provider that produced the response
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub fallback_provider: Option<String>,
+
+    /// Whether a fallback produced the response
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub fallback_used: Option<bool>,
+
+    /// Position of the successful fallback in the fallback list
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub fallback_index: Option<usize>,
+
+    /// Total attempts across all providers
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub attempts: Option<usize>,
+
+    /// Last error per failed provider
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub provider_errors: Option<HashMap<String, String>>,
+
+    /// Total time spent waiting between retries (milliseconds)
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub retry_delay_ms: Option<u64>,
+
+    /// Delay before each retry, per provider tried (milliseconds)
+    ///
+    /// Every provider restarts its backoff schedule, so delays are kept
+    /// separately for each one.
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub retry_delays_ms: Option<HashMap<String, Vec<u64>>>,
+
+    /// Timeout applied to the successful provider (milliseconds)
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub timeout_used_ms: Option<u64>,
+
+    /// Whether the request transformation lost information
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub transformation_lossy: Option<bool>,
+
+    /// Why the transformation was lossy
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub lossy_reasons: Option<Vec<String>>,
+}
+
+impl RoutingMetadata {
+    /// Whether no field has been recorded
+    pub fn is_empty(&self) -> bool {
+        *self == Self::default()
+    }
+
+    /// Recorded fields as (name, JSON value) pairs, in declaration order
+    pub fn entries(&self) -> Vec<(&'static str, Value)> {
+        fn push<T: Serialize>(
+            entries: &mut Vec<(&'static str, Value)>,
+            key: &'static str,
+            value: &Option<T>,
+        ) {
+            if let Some(value) = value {
+                entries.push((key, json!(value)));
+            }
+        }
+
+        let mut entries = Vec::new();
+        push(&mut entries, "primary_provider", &self.primary_provider);
+        push(&mut entries, "fallback_provider", &self.fallback_provider);
+        push(&mut entries, "fallback_used", &self.fallback_used);
+        push(&mut entries, "fallback_index", &self.fallback_index);
+        push(&mut entries, "attempts", &self.attempts);
+        push(&mut entries, "provider_errors", &self.provider_errors);
+        push(&mut entries, "retry_delay_ms", &self.retry_delay_ms);
+        push(&mut entries, "retry_delays_ms", &self.retry_delays_ms);
+        push(&mut entries, "timeout_used_ms", &self.timeout_used_ms);
+        push(
+            &mut entries,
+            "transformation_lossy",
+            &self.transformation_lossy,
+        );
+        push(&mut entries, "lossy_reasons", &self.lossy_reasons);
+        entries
+    }
+
+    /// Record transformation lossiness, if any
+    fn record_transform(&mut self, transform_result: Option<&TransformResult>) {
+        if let Some(transform_result) = transform_result.filter(|t| t.lossy) {
+            self.transformation_lossy = Some(true);
+            self.lossy_reasons = Some(transform_result.reasons.clone());
+        }
+    }
 }
 
 /// Trait for routing strategies
@@ -150,6 +254,9 @@ pub struct PrimaryWithFallbacks {
 
     /// HTTP client for making requests
     http_client: crate::http::client::HttpClient,
+
+    /// Observed latency per provider/model, used to size request timeouts
+    latency: Arc<LatencyTracker>,
 }
 
 impl PrimaryWithFallbacks {
@@ -164,9 +271,22 @@ impl PrimaryWithFallbacks {
             track_metadata: true,
             retry_policy: Some(crate::providers::retry::RetryPolicy::default()),
             http_client,
+            latency: Arc::new(LatencyTracker::new()),
         }
     }
 
+    /// Use the given HTTP client, e.g. `HttpClient::shared()`, for requests
+    pub fn with_http_client(mut self, client: crate::http::client::HttpClient) -> Self {
+        self.http_client = client;
+        self
+    }
+
+    /// Share a latency tracker with this router
+    pub fn with_latency_tracker(mut self, tracker: Arc<LatencyTracker>) -> Self {
+        self.latency = tracker;
+        self
+    }
+
     /// Set whether to track routing metadata
     pub fn with_metadata_tracking(mut self, enabled: bool) -> Self {
         self.track_metadata = enabled;
@@ -186,8 +306,12 @@ impl PrimaryWithFallbacks {
     }
 
     /// Execute request against a specific provider with retry logic (simplified for MVP)
-    /// Returns: (response, transform_result, errors, provider_tried_count, delay_ms)
+    /// Returns: (response, transform_result, errors, provider_tried_count, delays_ms, timeout)
     /// Note: provider_tried_count is always 1 (we tried this provider once)
+    ///
+    /// The timeout is re-derived from the latency stats before every attempt, so
+    /// a retry after a timeout gets the widened value. The returned timeout is
+    /// the one applied to the last attempt.
     async fn execute_with_retry(
         &self,
         request: &ChatRequest,
@@ -197,11 +321,13 @@ impl PrimaryWithFallbacks {
         Option<TransformResult>,
         Vec<ProviderError>,
         u32,
-        u64,
+        Vec<u64>,
+        Duration,
     ) {
         let mut attempts = 0;
-        let mut total_delay_ms = 0;
+        let mut delays_ms = Vec::new();
         let mut error_history = Vec::new();
+        let mut timeout = self.latency.timeout_for(provider.name(), &request.model);
 
         // Determine max attempts based on retry policy
         let max_attempts = if let Some(ref policy) = self.retry_policy {
@@ -211,14 +337,18 @@ impl PrimaryWithFallbacks {
         };
 
         while attempts < max_attempts {
-            match self.execute_with_provider(request, provider).await {
+            if attempts > 0 {
+                timeout = self.latency.timeout_for(provider.name(), &request.model);
+            }
+            match self.execute_with_provider(request, provider, timeout).await {
                 Ok((response, transform_result)) => {
                     return (
                         Some(response),
                         Some(transform_result),
                         error_history,
                         1,
-                        total_delay_ms,
+                        delays_ms,
+                        timeout,
                     );
                 }
                 Err(error) => {
@@ -230,7 +360,7 @@ impl PrimaryWithFallbacks {
                         if attempts < max_attempts && error.is_retryable() {
                             // Calculate delay
                             let delay = policy.calculate_delay(attempts - 1, &error);
-                            total_delay_ms += delay.as_millis() as u64;
+                            delays_ms.push(delay.as_millis() as u64);
 
                             // Sleep for the calculated delay
                             tokio::time::sleep(delay).await;
@@ -242,7 +372,7 @@ impl PrimaryWithFallbacks {
             }
         }
 
-        (None, None, error_history, 1, total_delay_ms)
+        (None, None, error_history, 1, delays_ms, timeout)
     }
 
     /// Execute request against a specific provider (single attempt)
@@ -250,17 +380,32 @@ impl PrimaryWithFallbacks {
         &self,
         request: &ChatRequest,
         provider: &Box<dyn Provider>,
+        timeout: Duration,
     ) -> Result<(ChatResponse, TransformResult), ProviderError> {
         use crate::http::{CallKind, HttpExecutor, RequestOptions};
 
         // Create request options with a new request ID
-        let options = RequestOptions::new(CallKind::Chat);
+        let options = RequestOptions::new(CallKind::Chat).with_timeout(timeout);
 
-        // Execute the HTTP request
-        let response = self
+        // Execute the HTTP request, feeding the outcome into the latency stats
+        let started = Instant::now();
+        let response = match self
             .http_client
             .execute_json(provider.as_ref(), request.clone(), options)
-            .await?;
+            .await
+        {
+            Ok(response) => {
+                self.latency
+                    .record_success(provider.name(), &request.model, started.elapsed());
+                response
+            }
+            Err(ProviderError::Timeout) => {
+                self.latency
+                    .record_timeout(provider.name(), &request.model, timeout);
+                return Err(ProviderError::Timeout);
+            }
+            Err(error) => return Err(error),
+        };
 
         // Create a TransformResult for tracking
         // Note: In a full implementation, we'd track actual transformations done by the provider
@@ -284,13 +429,15 @@ impl RoutingStrategy for PrimaryWithFallbacks {
             used_fallback: false,
             attempts: 0,
             provider_errors: HashMap::new(),
-            metadata: HashMap::new(),
+            metadata: RoutingMetadata::default(),
         };
 
         // Try primary provider first with retry logic
         let primary_name = self.primary.name().to_string();
-        let (response_opt, transform_opt, errors, attempts, delay_ms) =
+        let (response_opt, transform_opt, errors, attempts, delays_ms, timeout) =
             self.execute_with_retry(&request, &self.primary).await;
+        let mut retry_delay_ms: u64 = delays_ms.iter().sum();
+        let mut retry_delays_ms = HashMap::from([(primary_name.clone(), delays_ms)]);
 
         result.attempts += attempts as usize;
 
@@ -301,30 +448,18 @@ impl RoutingStrategy for PrimaryWithFallbacks {
             result.provider_used = primary_name.clone();
 
             if self.track_metadata {
+                result.metadata = RoutingMetadata {
+                    primary_provider: Some(primary_name),
+                    fallback_used: Some(false),
+                    attempts: Some(attempts as usize),
+                    retry_delay_ms: Some(retry_delay_ms),
+                    retry_delays_ms: Some(retry_delays_ms),
+                    timeout_used_ms: Some(timeout.as_millis() as u64),
+                    ..Default::default()
+                };
                 result
                     .metadata
-                    .insert("primary_provider".to_string(), json!(primary_name));
-                result
-                    .metadata
-                    .insert("fallback_used".to_string(), json!(false));
-                result
-                    .metadata
-                    .insert("attempts".to_string(), json!(attempts));
-                result
-                    .metadata
-                    .insert("retry_delay_ms".to_string(), json!(delay_ms));
-
-                // Add transform metadata if lossy
-                if let Some(ref transform_result) = result.transform_result {
-                    if transform_result.lossy {
-                        result
-                            .metadata
-                            .insert("transformation_lossy".to_string(), json!(true));
-                        result
-                            .metadata
-                            .insert("lossy_reasons".to_string(), json!(transform_result.reasons));
-                    }
-                }
+                    .record_transform(result.transform_result.as_ref());
             }
 
             return Ok(result);
@@ -344,10 +479,12 @@ impl RoutingStrategy for PrimaryWithFallbacks {
             // Try fallbacks
             for (idx, fallback) in self.fallbacks.iter().enumerate() {
                 let fallback_name = fallback.name().to_string();
-                let (response_opt, transform_opt, fb_errors, fb_attempts, _fb_delay_ms) =
+                let (response_opt, transform_opt, fb_errors, fb_attempts, fb_delays_ms, fb_timeout) =
                     self.execute_with_retry(&request, fallback).await;
 
                 result.attempts += fb_attempts as usize;
+                retry_delay_ms += fb_delays_ms.iter().sum::<u64>();
+                retry_delays_ms.insert(fallback_name.clone(), fb_delays_ms);
 
                 if let Some(response) = response_opt {
                     // Fallback succeeded
@@ -357,37 +494,21 @@ impl RoutingStrategy for PrimaryWithFallbacks {
                     result.used_fallback = true;
 
                     if self.track_metadata {
+                        result.metadata = RoutingMetadata {
+                            primary_provider: Some(primary_name),
+                            fallback_provider: Some(fallback_name),
+                            fallback_used: Some(true),
+                            fallback_index: Some(idx),
+                            attempts: Some(result.attempts),
+                            provider_errors: Some(result.provider_errors.clone()),
+                            retry_delay_ms: Some(retry_delay_ms),
+                            retry_delays_ms: Some(retry_delays_ms),
+                            timeout_used_ms: Some(fb_timeout.as_millis() as u64),
+                            ..Default::default()
+                        };
                         result
                             .metadata
-                            .insert("primary_provider".to_string(), json!(primary_name));
-                        result
-                            .metadata
-                            .insert("fallback_provider".to_string(), json!(fallback_name));
-                        result
-                            .metadata
-                            .insert("fallback_used".to_string(), json!(true));
-                        result
-                            .metadata
-                            .insert("fallback_index".to_string(), json!(idx));
-                        result
-                            .metadata
-                            .insert("attempts".to_string(), json!(result.attempts));
-                        result
-                            .metadata
-                            .insert("provider_errors".to_string(), json!(result.provider_errors));
-
-                        // Add transform metadata if lossy
-                        if let Some(ref transform_result) = result.transform_result {
-                            if transform_result.lossy {
-                                result
-                                    .metadata
-                                    .insert("transformation_lossy".to_string(), json!(true));
-                                result.metadata.insert(
-                                    "lossy_reasons".to_string(),
-                                    json!(transform_result.reasons),
-                                );
-                            }
-                        }
+                            .record_transform(result.transform_result.as_ref());
                     }
 
                     return Ok(result);
@@ -430,6 +551,9 @@ impl RoutingStrategy for PrimaryWithFallbacks {
 pub struct RoutingBuilder {
     primary: Option<Box<dyn Provider>>,
     fallbacks: Vec<Box<dyn Provider>>,
+    retry_policy: Option<crate::providers::retry::RetryPolicy>,
+    latency_tracker: Option<Arc<LatencyTracker>>,
+    http_client: Option<crate::http::client::HttpClient>,
 }
 
 impl RoutingBuilder {
@@ -438,6 +562,9 @@ impl RoutingBuilder {
         Self {
             primary: None,
             fallbacks: Vec::new(),
+            retry_policy: None,
+            latency_tracker: None,
+            http_client: None,
         }
     }
 
@@ -453,13 +580,46 @@ impl RoutingBuilder {
         self
     }
 
+    /// Set the retry policy (defaults to `RetryPolicy::default()`)
+    pub fn retry_policy(mut self, policy: crate::providers::retry::RetryPolicy) -> Self {
+        self.retry_policy = Some(policy);
+        self
+    }
+
+    /// Share a latency tracker used to derive adaptive request timeouts
+    pub fn latency_tracker(mut self, tracker: Arc<LatencyTracker>) -> Self {
+        self.latency_tracker = Some(tracker);
+        self
+    }
+
+    /// Set the HTTP client (defaults to a new client with its own pool)
+    ///
+    /// Pass `HttpClient::shared()` to reuse the process-wide connection pool.
+    /// Only do so when every request runs on the same long-lived tokio
+    /// runtime, since pooled connections are driven by the runtime that
+    /// opened them.
+    pub fn http_client(mut self, client: crate::http::client::HttpClient) -> Self {
+        self.http_client = Some(client);
+        self
+    }
+
     /// Build the routing strategy
     pub fn build(self) -> Result<PrimaryWithFallbacks, String> {
         let primary = self
             .primary
             .ok_or_else(|| "Primary provider required".to_string())?;
 
-        Ok(PrimaryWithFallbacks::new(primary, self.fallbacks))
+        let mut router = PrimaryWithFallbacks::new(primary, self.fallbacks);
+        if let Some(policy) = self.retry_policy {
+            router = router.with_retry_policy(policy);
+        }
+        if let Some(tracker) = self.latency_tracker {
+            router = router.with_latency_tracker(tracker);
+        }
+        if let Some(client) = self.http_client {
+            router = router.with_http_client(client);
+        }
+        Ok(router)
     }
 }
 
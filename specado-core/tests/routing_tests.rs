@@ -32,20 +32,8 @@ async fn test_primary_success_no_fallback() {
     assert!(result.provider_errors.is_empty());
 
     // Check metadata
-    assert_eq!(
-        result
-            .metadata
-            .get("fallback_used")
-            .and_then(|v| v.as_bool()),
-        Some(false)
-    );
-    assert_eq!(
-        result
-            .metadata
-            .get("primary_provider")
-            .and_then(|v| v.as_str()),
-        Some("openai")
-    );
+    assert_eq!(result.metadata.fallback_used, Some(false));
+    assert_eq!(result.metadata.primary_provider.as_deref(), Some("openai"));
 }
 
 #[tokio::test]
@@ -73,34 +61,13 @@ async fn test_fallback_on_timeout() {
     assert!(result.provider_errors.contains_key("openai"));
 
     // Check metadata
+    assert_eq!(result.metadata.fallback_used, Some(true));
+    assert_eq!(result.metadata.primary_provider.as_deref(), Some("openai"));
     assert_eq!(
-        result
-            .metadata
-            .get("fallback_used")
-            .and_then(|v| v.as_bool()),
-        Some(true)
-    );
-    assert_eq!(
-        result
-            .metadata
-            .get("primary_provider")
-            .and_then(|v| v.as_str()),
-        Some("openai")
-    );
-    assert_eq!(
-        result
-            .metadata
-            .get("fallback_provider")
-            .and_then(|v| v.as_str()),
+        result.metadata.fallback_provider.as_deref(),
         Some("anthropic")
     );
-    assert_eq!(
-        result
-            .metadata
-            .get("fallback_index")
-            .and_then(|v| v.as_u64()),
-        Some(0)
-    );
+    assert_eq!(result.metadata.fallback_index, Some(0));
 }
 
 #[tokio::test]
@@ -278,15 +245,9 @@ async fn test_transform_metadata_preservation() {
         .contains(&"system_role.merged".to_string()));
 
     // Check metadata includes transformation info
-    assert_eq!(
-        result
-            .metadata
-            .get("transformation_lossy")
-            .and_then(|v| v.as_bool()),
-        Some(true)
-    );
-    let reasons = result.metadata.get("lossy_reasons").unwrap();
-    assert!(reasons.as_array().unwrap().len() > 0);
+    assert_eq!(result.metadata.transformation_lossy, Some(true));
+    let reasons = result.metadata.lossy_reasons.as_ref().unwrap();
+    assert!(!reasons.is_empty());
 }
 
 #[tokio::test]
@@ -392,41 +353,29 @@ async fn test_openai_to_anthropic_transformation_integration() {
     // ========== PROVE METADATA PRESERVATION WORKS ==========
     // Check routing metadata
     assert_eq!(
-        result
-            .metadata
-            .get("primary_provider")
-            .and_then(|v| v.as_str()),
+        result.metadata.primary_provider.as_deref(),
         Some("openai"),
         "Should track original primary provider"
     );
     assert_eq!(
-        result
-            .metadata
-            .get("fallback_provider")
-            .and_then(|v| v.as_str()),
+        result.metadata.fallback_provider.as_deref(),
         Some("anthropic"),
         "Should track fallback provider used"
     );
     assert_eq!(
-        result
-            .metadata
-            .get("fallback_used")
-            .and_then(|v| v.as_bool()),
+        result.metadata.fallback_used,
         Some(true),
         "Should indicate fallback was used"
     );
 
     // Check transformation metadata
     assert_eq!(
-        result
-            .metadata
-            .get("transformation_lossy")
-            .and_then(|v| v.as_bool()),
+        result.metadata.transformation_lossy,
         Some(true),
         "Should track that transformation was lossy"
     );
     assert!(
-        result.metadata.contains_key("lossy_reasons"),
+        result.metadata.lossy_reasons.is_some(),
         "Should include detailed lossiness reasons"
     );
 
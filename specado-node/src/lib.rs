@@ -141,8 +141,8 @@ impl ChatCompletions {
         
         // Create extensions with proper type conversion
         let mut metadata = HashMap::new();
-        for (key, value) in result.metadata.iter() {
-            metadata.insert(key.clone(), value.to_string());
+        for (key, value) in result.metadata.entries() {
+            metadata.insert(key.to_string(), value.to_string());
         }
         
         let extensions = Extensions {
@@ -7,12 +7,14 @@ This demo showcases:
 2. Retry policies with exponential backoff
 3. Routing metadata exposure
 4. Error handling and resilience
+5. Concurrent requests with AsyncClient
 
 Run with: python examples/week2_demo.py
 """
 
+import asyncio
 import json
-from specado import Client, Message
+from specado import AsyncClient, Message, default_client
 
 
 def main():
@@ -23,10 +25,8 @@ def main():
     print("\n📝 Example 1: Basic Chat Completion")
     print("-" * 40)
     
-    client = Client({
-        'primary_provider': 'openai',
-        'fallback_provider': 'anthropic'
-    })
+    # Shared client: one router and connection pool for the whole demo
+    client = default_client()
     
     messages = [
         Message('system', 'You are a helpful assistant'),
@@ -164,6 +164,34 @@ def main():
     print(f"   Provider: {response.extensions.provider_used}")
     print(f"   Response: {response.choices[0].message.content[:100]}...")
     
+    # Example 8: Concurrent requests with asyncio
+    print("\n📝 Example 8: Concurrent Requests (asyncio)")
+    print("-" * 40)
+    
+    async def ask_all(questions):
+        async_client = AsyncClient({
+            'primary_provider': 'openai',
+            'fallback_provider': 'anthropic'
+        })
+        return await asyncio.gather(*(
+            async_client.chat.completions.create(
+                model='gpt-4',
+                messages=[Message('user', question)]
+            )
+            for question in questions
+        ))
+    
+    questions = [
+        'What is a circuit breaker?',
+        'What is exponential backoff?',
+        'What is connection pooling?'
+    ]
+    responses = asyncio.run(ask_all(questions))
+    
+    print(f"✅ {len(responses)} requests completed concurrently")
+    for question, response in zip(questions, responses):
+        print(f"   {question} -> {response.extensions.provider_used}")
+    
     # Summary
     print("\n" + "=" * 60)
     print("\n✨ Key Features Demonstrated:")
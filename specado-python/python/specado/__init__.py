@@ -4,18 +4,188 @@ This module provides Python bindings for the Specado core library,
 enabling spec-driven integration with various LLM providers.
 """
 
-from specado.specado import (
-    Client, Message, ChatCompletionResponse, Extensions,
-    version, __version__,
-    # Capability functions
-    get_openai_manifest, get_anthropic_manifest,
-    compare_capabilities, get_model_capabilities
-)
+import copy
+import importlib
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version as _package_version
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as _json_loads
+
+try:
+    __version__ = _package_version("specado")
+except PackageNotFoundError:  # not installed; __getattr__ asks the native module
+    pass
 
 __all__ = [
-    "Client", "Message", "ChatCompletionResponse", "Extensions",
-    "version", "__version__",
+    "Client", "AsyncClient", "Message", "Role", "ChatCompletionResponse", "Extensions",
+    "RoutingMetadata", "ResponseCache", "Manifest",
+    "version", "__version__", "default_client",
     # Capability functions
     "get_openai_manifest", "get_anthropic_manifest",
     "compare_capabilities", "get_model_capabilities"
 ]
+
+# Names re-exported from the compiled extension. They are resolved on first
+# access (PEP 562) so that `import specado` does not load the shared library.
+_NATIVE_NAMES = frozenset({
+    "Client", "AsyncClient", "Message", "Role", "ChatCompletionResponse", "Extensions",
+    "RoutingMetadata", "ResponseCache", "version", "__version__",
+})
+
+
+def _native():
+    """Import the compiled extension module."""
+    return importlib.import_module("specado.specado")
+
+
+def __getattr__(name):
+    if name in _NATIVE_NAMES:
+        value = getattr(_native(), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client():
+    """Get a process-wide Client using the default provider configuration.
+
+    Reusing one client avoids rebuilding the router for every call site. If
+    the shared client has been closed, a new one replaces it.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None or _default_client.closed:
+            _default_client = _native().Client(
+                {"primary_provider": "openai", "fallback_provider": "anthropic"}
+            )
+        return _default_client
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class _FrozenDict(dict):
+    """A dict that rejects mutation, used for values shared from a cache.
+
+    Subclassing dict keeps cached values JSON-serializable and usable
+    wherever a plain dict was returned before. `copy.copy` and
+    `copy.deepcopy` return plain, editable containers.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(item, memo) for key, item in self.items()}
+
+
+class _FrozenList(list):
+    """A list that rejects mutation, used for values shared from a cache."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+
+def _freeze(value):
+    """Recursively make a cached value read-only so callers cannot mutate the shared copy."""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+class Manifest(Mapping):
+    """Read-only view over a provider manifest.
+
+    The manifest is kept as the JSON string produced by the core library and
+    only decoded the first time a key is accessed. Nested values are
+    read-only because the manifest is shared process-wide. A Manifest is not
+    a dict, so serialize it with `json()` rather than `json.dumps`.
+    """
+
+    __slots__ = ("_raw", "_parsed")
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._parsed = None
+
+    def _data(self):
+        if self._parsed is None:
+            self._parsed = _freeze(_json_loads(self._raw))
+        return self._parsed
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self):
+        return len(self._data())
+
+    def __repr__(self):
+        return f"Manifest({self._raw[:60]}...)"
+
+    def json(self):
+        """Return the manifest as its original JSON string."""
+        return self._raw
+
+
+# Provider manifests are static for the lifetime of the process, so they are
+# built once and shared instead of being re-serialized across the FFI boundary
+# on every call.
+@lru_cache(maxsize=1)
+def get_openai_manifest():
+    """Get the OpenAI provider manifest (cached, read-only)."""
+    return Manifest(_native().get_openai_manifest_json())
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_manifest():
+    """Get the Anthropic provider manifest (cached, read-only)."""
+    return Manifest(_native().get_anthropic_manifest_json())
+
+
+@lru_cache(maxsize=64)
+def get_model_capabilities(provider, model_id):
+    """Get capabilities for a provider/model pair (cached, read-only)."""
+    return _freeze(_native().get_model_capabilities(provider, model_id))
+
+
+def compare_capabilities(source, target):
+    """Compare two capabilities and return a lossiness report."""
+    return _native().compare_capabilities(dict(source), dict(target))
@@ -0,0 +1,187 @@
+//! Exact-match cache for chat completion responses
+
+use lru::LruCache;
+use pyo3::prelude::*;
+use specado_core::protocol::types::{ChatRequest as CoreChatRequest, MessageContent};
+use specado_core::providers::RoutingResult;
+use std::fmt::Write;
+use std::hash::{Hash, Hasher};
+use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
+use xxhash_rust::xxh3::Xxh3;
+
+/// Default number of cached responses per client
+pub const DEFAULT_CAPACITY: usize = 256;
+
+/// Bounded LRU cache of routing results, shared by a client's completions API
+///
+/// Only deterministic requests are cached: `temperature=0` or a fixed `seed`.
+#[pyclass(module = "specado")]
+#[derive(Clone)]
+pub struct ResponseCache {
+    entries: Arc<Mutex<LruCache<u64, RoutingResult>>>,
+    hits: Arc<AtomicU64>,
+    misses: Arc<AtomicU64>,
+}
+
+impl ResponseCache {
+    /// Create a cache holding at most `capacity` responses
+    pub fn new(capacity: NonZeroUsize) -> Self {
+        Self {
+            entries: Arc::new(Mutex::new(LruCache::new(capacity))),
+            hits: Arc::new(AtomicU64::new(0)),
+            misses: Arc::new(AtomicU64::new(0)),
+        }
+    }
+
+    /// Cache key for a request, or `None` if its output is not deterministic
+    pub fn key_for(request: &CoreChatRequest) -> Option<u64> {
+        if request.temperature != Some(0.0) && request.seed.is_none() {
+            return None;
+        }
+
+        // Content fingerprint, not a HashMap key, so XXH3 is used instead of
+        // SipHash: it is much faster on long prompts and HashDoS does not apply
+        let mut hasher = Xxh3::new();
+        request.model.hash(&mut hasher);
+        request
+            .temperature
+            .map(|t| (t * 1000.0).round() as i32)
+            .hash(&mut hasher);
+        request.max_tokens.hash(&mut hasher);
+        request.seed.hash(&mut hasher);
+        for message in &request.messages {
+            (message.role as u8).hash(&mut hasher);
+            match &message.content {
+                MessageContent::Text(text) => text.hash(&mut hasher),
+                MessageContent::Parts(parts) => serde_json::to_string(parts).ok().hash(&mut hasher),
+            }
+        }
+        Some(hasher.finish())
+    }
+
+    /// Look up a cached result, counting the hit or miss
+    pub fn lookup(&self, key: u64) -> Option<RoutingResult> {
+        let cached = self
+            .entries
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .get(&key)
+            .cloned();
+
+        let counter = if cached.is_some() {
+            &self.hits
+        } else {
+            &self.misses
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
+        cached
+    }
+
+    /// Store a freshly routed result
+    pub fn store(&self, key: u64, result: &RoutingResult) {
+        self.entries
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .put(key, result.clone());
+    }
+}
+
+#[pymethods]
+impl ResponseCache {
+    /// Number of lookups answered from the cache
+    #[getter]
+    fn hits(&self) -> u64 {
+        self.hits.load(Ordering::Relaxed)
+    }
+
+    /// Number of lookups that had to be routed to a provider
+    #[getter]
+    fn misses(&self) -> u64 {
+        self.misses.load(Ordering::Relaxed)
+    }
+
+    /// Maximum number of cached responses
+    #[getter]
+    fn capacity(&self) -> usize {
+        self.entries
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .cap()
+            .get()
+    }
+
+    /// Drop all cached responses
+    fn clear(&self) {
+        self.entries
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .clear();
+    }
+
+    fn __len__(&self) -> usize {
+        self.entries.lock().unwrap_or_else(|e| e.into_inner()).len()
+    }
+
+    fn __repr__(&self) -> String {
+        let mut repr = String::with_capacity(64);
+        let _ = write!(
+            repr,
+            "ResponseCache(size={}, capacity={}, hits={}, misses={})",
+            self.__len__(),
+            self.capacity(),
+            self.hits(),
+            self.misses()
+        );
+        repr
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use specado_core::protocol::types::Message as CoreMessage;
+
+    fn request(temperature: Option<f32>) -> CoreChatRequest {
+        let mut request = CoreChatRequest::new("gpt-4", vec![CoreMessage::user("Hello")]);
+        request.temperature = temperature;
+        request
+    }
+
+    #[test]
+    fn test_key_requires_deterministic_request() {
+        assert!(ResponseCache::key_for(&request(None)).is_none());
+        assert!(ResponseCache::key_for(&request(Some(0.7))).is_none());
+        assert!(ResponseCache::key_for(&request(Some(0.0))).is_some());
+
+        let mut seeded = request(Some(0.7));
+        seeded.seed = Some(42);
+        assert!(ResponseCache::key_for(&seeded).is_some());
+    }
+
+    #[test]
+    fn test_key_depends_on_messages() {
+        let a = request(Some(0.0));
+        let mut b = request(Some(0.0));
+        b.messages.push(CoreMessage::user("Again"));
+
+        assert_eq!(
+            ResponseCache::key_for(&a),
+            ResponseCache::key_for(&a.clone())
+        );
+        assert_ne!(ResponseCache::key_for(&a), ResponseCache::key_for(&b));
+    }
+
+    #[test]
+    fn test_key_depends_on_role() {
+        let user = request(Some(0.0));
+        let mut system = request(Some(0.0));
+        system.messages = vec![CoreMessage::system("Hello")];
+
+        assert_ne!(
+            ResponseCache::key_for(&user),
+            ResponseCache::key_for(&system)
+        );
+    }
+}
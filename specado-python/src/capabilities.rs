@@ -3,33 +3,55 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use specado_core::capabilities::{ProviderManifest, Capability};
+use std::sync::OnceLock;
 
-/// Get OpenAI provider manifest
-#[pyfunction]
-fn get_openai_manifest(py: Python) -> PyResult<PyObject> {
-    let manifest = ProviderManifest::openai();
-    let json_str = serde_json::to_string(&manifest)
+/// Serialized manifests, built once per process
+static OPENAI_MANIFEST_JSON: OnceLock<String> = OnceLock::new();
+static ANTHROPIC_MANIFEST_JSON: OnceLock<String> = OnceLock::new();
+
+/// Serialize a manifest into the given cell on first use
+fn cached_manifest_json(
+    cell: &'static OnceLock<String>,
+    build: fn() -> ProviderManifest,
+) -> PyResult<&'static str> {
+    if let Some(json_str) = cell.get() {
+        return Ok(json_str);
+    }
+    let json_str = serde_json::to_string(&build())
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
-    
-    // Parse JSON string into Python dict
+    Ok(cell.get_or_init(|| json_str))
+}
+
+/// Parse a JSON string into Python objects
+fn json_loads(py: Python, json_str: &str) -> PyResult<PyObject> {
     let json_module = py.import("json")?;
     let loads = json_module.getattr("loads")?;
     let result = loads.call1((json_str,))?;
     Ok(result.into())
 }
 
+/// Get OpenAI provider manifest as a serialized JSON string
+#[pyfunction]
+fn get_openai_manifest_json() -> PyResult<&'static str> {
+    cached_manifest_json(&OPENAI_MANIFEST_JSON, ProviderManifest::openai)
+}
+
+/// Get Anthropic provider manifest as a serialized JSON string
+#[pyfunction]
+fn get_anthropic_manifest_json() -> PyResult<&'static str> {
+    cached_manifest_json(&ANTHROPIC_MANIFEST_JSON, ProviderManifest::anthropic)
+}
+
+/// Get OpenAI provider manifest
+#[pyfunction]
+fn get_openai_manifest(py: Python) -> PyResult<PyObject> {
+    json_loads(py, get_openai_manifest_json()?)
+}
+
 /// Get Anthropic provider manifest
 #[pyfunction]
 fn get_anthropic_manifest(py: Python) -> PyResult<PyObject> {
-    let manifest = ProviderManifest::anthropic();
-    let json_str = serde_json::to_string(&manifest)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
-    
-    // Parse JSON string into Python dict
-    let json_module = py.import("json")?;
-    let loads = json_module.getattr("loads")?;
-    let result = loads.call1((json_str,))?;
-    Ok(result.into())
+    json_loads(py, get_anthropic_manifest_json()?)
 }
 
 /// Compare two capabilities and return lossiness report
@@ -95,6 +117,8 @@ fn get_model_capabilities(py: Python, provider: &str, model_id: &str) -> PyResul
 pub fn register_capabilities(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(get_openai_manifest, m)?)?;
     m.add_function(wrap_pyfunction!(get_anthropic_manifest, m)?)?;
+    m.add_function(wrap_pyfunction!(get_openai_manifest_json, m)?)?;
+    m.add_function(wrap_pyfunction!(get_anthropic_manifest_json, m)?)?;
     m.add_function(wrap_pyfunction!(compare_capabilities, m)?)?;
     m.add_function(wrap_pyfunction!(get_model_capabilities, m)?)?;
     Ok(())
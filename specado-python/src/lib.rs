@@ -3,17 +3,34 @@
 //! This crate provides Python bindings for the Specado core library using PyO3 v0.25.1.
 
 use pyo3::prelude::*;
-use pyo3::exceptions::{PyRuntimeError, PyValueError, PyTypeError};
-use pyo3::types::{PyDict, PyList};
+use pyo3::exceptions::{PyIndexError, PyRuntimeError, PyValueError, PyTypeError};
+use pyo3::pybacked::PyBackedStr;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyIterator, PyList, PySlice, PyString};
+use pyo3::IntoPyObjectExt;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use specado_core::protocol::types::{ChatRequest as CoreChatRequest, Message as CoreMessage};
+use specado_core::http::client::HttpClient;
+use specado_core::protocol::types::{
+    ChatRequest as CoreChatRequest, ChatResponse, Message as CoreMessage, MessageBuilder,
+    MessageContent, MessageRole,
+};
 use specado_core::providers::{
-    OpenAIProvider, AnthropicProvider, Provider, RoutingBuilder, RoutingStrategy,
+    OpenAIProvider, AnthropicProvider, LatencyTracker, Provider, RetryPolicy, RoutingBuilder,
+    RoutingResult, RoutingStrategy, DEFAULT_MAX_TIMEOUT, DEFAULT_MIN_TIMEOUT,
 };
 use std::collections::HashMap;
+use std::fmt::Write;
+use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::Arc;
-use tokio::sync::Mutex;
+use std::time::Duration;
+
+/// Process-wide tokio runtime shared by sync and asyncio calls, so pooled
+/// connections outlive individual requests
+fn runtime() -> &'static tokio::runtime::Runtime {
+    pyo3_async_runtimes::tokio::get_runtime()
+}
 
 /// Structured error types for better error reporting
 #[derive(Debug)]
@@ -35,12 +52,74 @@ impl From<SpecadoError> for PyErr {
     }
 }
 
+/// Message author role
+#[pyclass(module = "specado", eq, eq_int, hash, frozen)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, Serialize, Deserialize)]
+#[serde(rename_all = "lowercase")]
+pub enum Role {
+    System = 0,
+    User = 1,
+    Assistant = 2,
+    Tool = 3,
+}
+
+impl Role {
+    /// Lowercase name used on the wire and in Python
+    fn as_str(self) -> &'static str {
+        match self {
+            Role::System => "system",
+            Role::User => "user",
+            Role::Assistant => "assistant",
+            Role::Tool => "tool",
+        }
+    }
+    
+    /// Parse a role name
+    fn parse(name: &str) -> PyResult<Self> {
+        match name {
+            "system" => Ok(Role::System),
+            "user" => Ok(Role::User),
+            "assistant" => Ok(Role::Assistant),
+            "tool" => Ok(Role::Tool),
+            _ => Err(PyValueError::new_err(format!(
+                "Invalid role '{}': expected 'system', 'user', 'assistant' or 'tool'",
+                name
+            ))),
+        }
+    }
+}
+
+#[pymethods]
+impl Role {
+    fn __str__(&self) -> &'static str {
+        self.as_str()
+    }
+}
+
+impl From<Role> for MessageRole {
+    fn from(role: Role) -> Self {
+        match role {
+            Role::System => MessageRole::System,
+            Role::User => MessageRole::User,
+            Role::Assistant => MessageRole::Assistant,
+            Role::Tool => MessageRole::Tool,
+        }
+    }
+}
+
+/// Accept either a `Role` or its name
+fn extract_role(obj: &Bound<'_, PyAny>) -> PyResult<Role> {
+    if let Ok(role) = obj.downcast::<Role>() {
+        return Ok(*role.borrow());
+    }
+    Role::parse(&obj.extract::<PyBackedStr>()?)
+}
+
 /// Python-compatible message structure
 #[pyclass(module = "specado")]
 #[derive(Clone, Debug, Serialize, Deserialize)]
 pub struct Message {
-    #[pyo3(get, set)]
-    pub role: String,
+    pub role: Role,
     #[pyo3(get, set)]
     pub content: String,
 }
@@ -48,22 +127,72 @@ pub struct Message {
 #[pymethods]
 impl Message {
     #[new]
-    fn new(role: String, content: String) -> Self {
+    fn new(#[pyo3(from_py_with = extract_role)] role: Role, content: String) -> Self {
         Self { role, content }
     }
     
+    /// Build several messages from (role, content) pairs in one call
+    #[staticmethod]
+    fn many<'py>(pairs: Vec<(Bound<'py, PyAny>, String)>) -> PyResult<Vec<Message>> {
+        pairs
+            .into_iter()
+            .map(|(role, content)| {
+                Ok(Self {
+                    role: extract_role(&role)?,
+                    content,
+                })
+            })
+            .collect()
+    }
+    
+    /// Role name as an interned string
+    #[getter(role)]
+    fn role_name<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        PyString::intern(py, self.role.as_str())
+    }
+    
+    #[setter(role)]
+    fn set_role(&mut self, role: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.role = extract_role(role)?;
+        Ok(())
+    }
+    
     fn __repr__(&self) -> String {
-        format!("Message(role='{}', content='{}')", self.role, self.content)
+        let mut repr = String::with_capacity(40 + self.content.len());
+        let _ = write!(repr, "Message(role='{}', content='{}')", self.role.as_str(), self.content);
+        repr
     }
     
     fn __str__(&self) -> String {
-        format!("{}: {}", self.role, self.content)
+        let mut text = String::with_capacity(12 + self.content.len());
+        let _ = write!(text, "{}: {}", self.role.as_str(), self.content);
+        text
     }
 }
 
+/// Convert a role/content pair into a core message
+fn to_core_message(role: Role, content: &str) -> CoreMessage {
+    MessageBuilder::new(role.into(), content).build()
+}
+
+/// Convert a `Message` or a `(role, content)` tuple into a core message
+fn extract_core_message(obj: &Bound<'_, PyAny>) -> PyResult<CoreMessage> {
+    if let Ok(msg) = obj.downcast::<Message>() {
+        let msg = msg.borrow();
+        return Ok(to_core_message(msg.role, &msg.content));
+    }
+    
+    let (role, content) = obj.extract::<(Bound<'_, PyAny>, String)>().map_err(|_| {
+        SpecadoError::MessageFormatError(
+            "expected a Message or a (role, content) tuple".to_string(),
+        )
+    })?;
+    Ok(to_core_message(extract_role(&role)?, &content))
+}
+
 /// Response extensions containing routing metadata
 #[pyclass(module = "specado")]
-#[derive(Clone, Debug)]
+#[derive(Debug)]
 pub struct Extensions {
     #[pyo3(get)]
     pub provider_used: String,
@@ -71,46 +200,21 @@ pub struct Extensions {
     pub fallback_triggered: bool,
     #[pyo3(get)]
     pub attempts: usize,
-    metadata_internal: HashMap<String, Value>,
+    /// Built once per response so every access returns the same object
+    #[pyo3(get)]
+    pub metadata: Py<RoutingMetadata>,
 }
 
 #[pymethods]
 impl Extensions {
-    #[getter]
-    fn metadata(&self, py: Python) -> PyResult<Py<PyDict>> {
-        let dict = PyDict::new(py);
-        for (key, value) in &self.metadata_internal {
-            match value {
-                Value::String(s) => dict.set_item(key, s.clone())?,
-                Value::Number(n) => {
-                    if let Some(i) = n.as_u64() {
-                        dict.set_item(key, i)?;
-                    } else if let Some(f) = n.as_f64() {
-                        dict.set_item(key, f)?;
-                    } else {
-                        dict.set_item(key, n.to_string())?;
-                    }
-                },
-                Value::Bool(b) => dict.set_item(key, *b)?,
-                Value::Array(arr) => {
-                    let py_list = PyList::empty(py);
-                    for item in arr {
-                        py_list.append(item.to_string())?;
-                    }
-                    dict.set_item(key, py_list)?;
-                },
-                Value::Object(_) => dict.set_item(key, value.to_string())?,
-                Value::Null => dict.set_item(key, py.None())?,
-            }
-        }
-        Ok(dict.unbind())
-    }
-    
     fn __repr__(&self) -> String {
-        format!(
+        let mut repr = String::with_capacity(80);
+        let _ = write!(
+            repr,
             "Extensions(provider_used='{}', fallback_triggered={}, attempts={})",
             self.provider_used, self.fallback_triggered, self.attempts
-        )
+        );
+        repr
     }
 }
 
@@ -129,10 +233,97 @@ pub struct Choice {
 #[pymethods]
 impl Choice {
     fn __repr__(&self) -> String {
-        format!(
+        let mut repr = String::with_capacity(48);
+        let _ = write!(
+            repr,
             "Choice(index={}, finish_reason={:?})",
             self.index, self.finish_reason
-        )
+        );
+        repr
+    }
+}
+
+/// Sequence of response choices, converted to Python objects on first access
+///
+/// Most callers only read `choices[0]`, so choices are built one at a time
+/// from the core response and memoized instead of all up front.
+#[pyclass(module = "specado", sequence)]
+pub struct LazyChoices {
+    response: Arc<ChatResponse>,
+    built: Vec<GILOnceCell<Py<Choice>>>,
+}
+
+impl LazyChoices {
+    fn new(response: Arc<ChatResponse>) -> Self {
+        let built = response.choices.iter().map(|_| GILOnceCell::new()).collect();
+        Self { response, built }
+    }
+    
+    /// Get the choice at a non-negative index, building it if needed
+    fn choice(&self, py: Python, index: usize) -> PyResult<Py<Choice>> {
+        self.built[index]
+            .get_or_try_init(py, || {
+                let choice = &self.response.choices[index];
+                
+                // Extract message content
+                let content = match &choice.message.content {
+                    MessageContent::Text(text) => text.clone(),
+                    MessageContent::Parts(_) => {
+                        // For multimodal, just use a placeholder for now
+                        "[Multimodal content]".to_string()
+                    }
+                };
+                let message = Py::new(py, Message {
+                    role: Role::Assistant,
+                    content,
+                })?;
+                
+                Py::new(py, Choice {
+                    index: choice.index,
+                    message,
+                    finish_reason: choice.finish_reason.clone(),
+                })
+            })
+            .map(|choice| choice.clone_ref(py))
+    }
+}
+
+#[pymethods]
+impl LazyChoices {
+    fn __len__(&self) -> usize {
+        self.built.len()
+    }
+    
+    /// Get one choice by index, or a list of choices for a slice
+    fn __getitem__(&self, py: Python, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let len = self.built.len() as isize;
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let indices = slice.indices(len)?;
+            let choices = (0..indices.slicelength as isize)
+                .map(|i| self.choice(py, (indices.start + i * indices.step) as usize))
+                .collect::<PyResult<Vec<_>>>()?;
+            return PyList::new(py, choices)?.into_py_any(py);
+        }
+        
+        let index: isize = index.extract()?;
+        let resolved = if index < 0 { index + len } else { index };
+        if !(0..len).contains(&resolved) {
+            return Err(PyIndexError::new_err("choice index out of range"));
+        }
+        self.choice(py, resolved as usize)?.into_py_any(py)
+    }
+    
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        let choices = (0..self.built.len())
+            .map(|index| self.choice(py, index))
+            .collect::<PyResult<Vec<_>>>()?;
+        PyList::new(py, choices)?.as_any().try_iter()
+    }
+    
+    fn __repr__(&self) -> String {
+        let mut repr = String::with_capacity(20);
+        let _ = write!(repr, "LazyChoices(len={})", self.built.len());
+        repr
     }
 }
 
@@ -149,164 +340,304 @@ pub struct ChatCompletionResponse {
     #[pyo3(get)]
     pub model: String,
     #[pyo3(get)]
-    pub choices: Py<PyList>,
+    pub choices: Py<LazyChoices>,
     #[pyo3(get)]
     pub extensions: Py<Extensions>,
 }
 
 #[pymethods]
 impl ChatCompletionResponse {
-    fn __repr__(&self) -> String {
-        format!(
+    fn __repr__(&self, py: Python) -> String {
+        // Borrow the Rust-side extensions rather than going through getattr
+        let extensions = self.extensions.borrow(py);
+        let mut repr = String::with_capacity(128);
+        let _ = write!(
+            repr,
             "ChatCompletionResponse(id='{}', model='{}', provider_used='{}')",
-            self.id,
-            self.model,
-            Python::with_gil(|py| {
-                self.extensions
-                    .bind(py)
-                    .getattr("provider_used")
-                    .unwrap()
-                    .extract::<String>()
-                    .unwrap_or_else(|_| "unknown".to_string())
-            })
-        )
+            self.id, self.model, extensions.provider_used
+        );
+        repr
     }
     
     fn __str__(&self) -> String {
-        format!("ChatCompletion[{}] - Model: {}", self.id, self.model)
+        let mut text = String::with_capacity(64);
+        let _ = write!(text, "ChatCompletion[{}] - Model: {}", self.id, self.model);
+        text
     }
 }
 
 /// Shared router state
-type SharedRouter = Arc<Mutex<Box<dyn RoutingStrategy>>>;
+///
+/// `RoutingStrategy::route` takes `&self`, so concurrent requests share the
+/// router without a lock.
+type SharedRouter = Arc<dyn RoutingStrategy>;
+
+/// Outcome of the background connection warm-up started by `Client`
+#[derive(Default)]
+struct Prewarm {
+    /// Slowest provider warm-up in milliseconds, once finished
+    latency_ms: std::sync::Mutex<Option<u64>>,
+    /// Whether the latency has been reported on a response yet
+    reported: AtomicBool,
+}
+
+impl Prewarm {
+    /// Record one provider's warm-up time
+    fn record(&self, elapsed: Duration) {
+        let ms = elapsed.as_millis() as u64;
+        let mut latency = self.latency_ms.lock().unwrap_or_else(|e| e.into_inner());
+        *latency = Some(latency.map_or(ms, |current| current.max(ms)));
+    }
+    
+    /// Warm-up latency to report on the first response after warm-up finished
+    fn take_report(&self) -> Option<u64> {
+        let latency = *self.latency_ms.lock().unwrap_or_else(|e| e.into_inner());
+        latency.filter(|_| !self.reported.swap(true, Ordering::AcqRel))
+    }
+}
+
+/// Open connections to the given providers in the background
+fn spawn_prewarm(providers: Vec<Box<dyn Provider>>, state: Arc<Prewarm>) {
+    let Ok(http) = HttpClient::shared() else {
+        return;
+    };
+    runtime().spawn(async move {
+        let warmups = providers.iter().map(|provider| http.prewarm(provider.as_ref()));
+        for elapsed in futures::future::join_all(warmups).await.into_iter().flatten() {
+            state.record(elapsed);
+        }
+    });
+}
 
 /// Chat completions API interface
 #[pyclass(module = "specado")]
 struct ChatCompletions {
     router: SharedRouter,
+    closed: Arc<AtomicBool>,
+    prewarm: Arc<Prewarm>,
+    cache: ResponseCache,
 }
 
-#[pymethods]
 impl ChatCompletions {
-    /// Create a chat completion (sync wrapper for async operation)
-    #[pyo3(signature = (model, messages, temperature=None, max_tokens=None))]
-    fn create(
+    /// Validate the client state and convert Python arguments into a core request
+    fn build_request(
         &self,
-        py: Python,
-        model: String,
-        messages: Vec<Py<Message>>,
+        model: &str,
+        messages: &[Bound<'_, PyAny>],
         temperature: Option<f32>,
         max_tokens: Option<u32>,
-    ) -> PyResult<ChatCompletionResponse> {
-        let router = self.router.clone();
+        seed: Option<i64>,
+    ) -> PyResult<CoreChatRequest> {
+        if self.closed.load(Ordering::Acquire) {
+            return Err(SpecadoError::RuntimeError("Client is closed".to_string()).into());
+        }
         
-        // Convert Python messages to core messages with proper error handling
-        let core_messages: PyResult<Vec<CoreMessage>> = messages
+        // Convert Python messages (or plain tuples) to core messages
+        let core_messages = messages
             .iter()
-            .map(|msg| {
-                let msg_ref = msg.bind(py);
-                let role = msg_ref.getattr("role")?.extract::<String>()?;
-                let content = msg_ref.getattr("content")?.extract::<String>()?;
-                
-                Ok(match role.as_str() {
-                    "system" => CoreMessage::system(&content),
-                    "user" => CoreMessage::user(&content),
-                    "assistant" => CoreMessage::assistant(&content),
-                    _ => CoreMessage::user(&content), // Default to user
-                })
-            })
-            .collect();
-        let core_messages = core_messages?;
+            .map(extract_core_message)
+            .collect::<PyResult<Vec<CoreMessage>>>()?;
         
         // Create chat request
-        let mut request = CoreChatRequest::new(&model, core_messages);
+        let mut request = CoreChatRequest::new(model, core_messages);
         if let Some(temp) = temperature {
             request.temperature = Some(temp);
         }
         if let Some(max_tok) = max_tokens {
             request.max_tokens = Some(max_tok as usize);
         }
+        request.seed = seed;
         
-        // Execute async operation in blocking manner
-        // In production, we'd use pyo3-asyncio for proper async support
-        let runtime = tokio::runtime::Runtime::new()
-            .map_err(|e| SpecadoError::RuntimeError(format!("Failed to create runtime: {}", e)))?;
-        
-        let request_model = request.model.clone();
-        let result = runtime.block_on(async move {
-            let router_guard = router.lock().await;
-            router_guard.route(request).await
-        }).map_err(|e| SpecadoError::ProviderError(format!("Routing failed: {}", e)))?;
-        
-        // Create extensions
-        let extensions = Py::new(py, Extensions {
-            provider_used: result.provider_used.clone(),
-            fallback_triggered: result.used_fallback,
-            attempts: result.attempts,
-            metadata_internal: result.metadata.clone(),
-        })?;
-        
-        // Extract actual response from routing result
-        let response = result.response
-            .ok_or_else(|| SpecadoError::RuntimeError("No response received from provider".to_string()))?;
-        
-        // Convert the first choice to Python format
-        let first_choice = response.choices.first()
-            .ok_or_else(|| SpecadoError::RuntimeError("No choices in response".to_string()))?;
-        
-        // Extract message content
-        let message_content = match &first_choice.message.content {
-            specado_core::protocol::types::MessageContent::Text(text) => text.clone(),
-            specado_core::protocol::types::MessageContent::Parts(_) => {
-                // For multimodal, just use a placeholder for now
-                "[Multimodal content]".to_string()
-            }
-        };
-        
-        let message = Py::new(py, Message {
-            role: "assistant".to_string(),
-            content: message_content,
-        })?;
-        
-        // Create choice
-        let choice = Choice {
-            index: first_choice.index,
-            message,
-            finish_reason: first_choice.finish_reason.clone(),
-        };
-        
-        // Create choices list 
-        let choice_py = Py::new(py, choice)?;
-        let choices_list = PyList::new(py, vec![choice_py])?;
-        
-        // Create response using actual response data
-        let response_obj = ChatCompletionResponse {
-            id: response.id.clone(),
-            object: response.object.clone(),
-            created: response.created as u64,
-            model: response.model.clone(),
-            choices: choices_list.into(),
-            extensions,
-        };
+        Ok(request)
+    }
+    
+    /// Cache key for the request when caching is enabled and applicable
+    fn cache_key(&self, request: &CoreChatRequest, enable_cache: bool) -> Option<u64> {
+        enable_cache.then(|| ResponseCache::key_for(request)).flatten()
+    }
+}
+
+/// Route a request through the shared router
+async fn route_request(
+    router: SharedRouter,
+    request: CoreChatRequest,
+) -> PyResult<RoutingResult> {
+    router
+        .route(request)
+        .await
+        .map_err(|e| SpecadoError::ProviderError(format!("Routing failed: {}", e)).into())
+}
+
+/// Metadata for a result answered from the response cache
+fn cached_metadata(result: &RoutingResult) -> RoutingMetadata {
+    RoutingMetadata {
+        cache_hit: Some(true),
+        ..RoutingMetadata::from_core(&result.metadata)
+    }
+}
+
+/// Cache a freshly routed result if requested and build its metadata
+fn record_routed(
+    result: &RoutingResult,
+    cache: &ResponseCache,
+    cache_key: Option<u64>,
+    prewarm: &Prewarm,
+) -> RoutingMetadata {
+    let mut metadata = RoutingMetadata::from_core(&result.metadata);
+    if let Some(key) = cache_key {
+        cache.store(key, result);
+        metadata.cache_hit = Some(false);
+    }
+    metadata.prewarm_latency_ms = prewarm.take_report();
+    metadata
+}
+
+/// Convert a routing result into a Python response object
+fn build_response(
+    py: Python,
+    result: RoutingResult,
+    metadata: RoutingMetadata,
+) -> PyResult<ChatCompletionResponse> {
+    // Create extensions
+    let extensions = Py::new(py, Extensions {
+        provider_used: result.provider_used.clone(),
+        fallback_triggered: result.used_fallback,
+        attempts: result.attempts,
+        metadata: Py::new(py, metadata)?,
+    })?;
+    
+    // Extract actual response from routing result
+    let response = result.response
+        .ok_or_else(|| SpecadoError::RuntimeError("No response received from provider".to_string()))?;
+    
+    if response.choices.is_empty() {
+        return Err(SpecadoError::RuntimeError("No choices in response".to_string()).into());
+    }
+    
+    let response = Arc::new(response);
+    let choices = Py::new(py, LazyChoices::new(response.clone()))?;
+    
+    // Create response using actual response data
+    Ok(ChatCompletionResponse {
+        id: response.id.clone(),
+        object: response.object.clone(),
+        created: response.created as u64,
+        model: response.model.clone(),
+        choices,
+        extensions,
+    })
+}
+
+#[pymethods]
+impl ChatCompletions {
+    /// Create a chat completion (sync wrapper for async operation)
+    ///
+    /// With `enable_cache=True`, deterministic requests (`temperature=0` or a
+    /// fixed `seed`) are answered from the client's response cache when an
+    /// identical request has been made before.
+    #[pyo3(signature = (model, messages, temperature=None, max_tokens=None, enable_cache=false, seed=None))]
+    fn create(
+        &self,
+        py: Python,
+        model: String,
+        messages: Vec<Bound<'_, PyAny>>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        enable_cache: bool,
+        seed: Option<i64>,
+    ) -> PyResult<ChatCompletionResponse> {
+        let request = self.build_request(&model, &messages, temperature, max_tokens, seed)?;
+        let cache_key = self.cache_key(&request, enable_cache);
+        if let Some(result) = cache_key.and_then(|key| self.cache.lookup(key)) {
+            let metadata = cached_metadata(&result);
+            return build_response(py, result, metadata);
+        }
         
-        Ok(response_obj)
+        // Release the GIL for the whole routing/retry/fallback phase so other
+        // Python threads keep running while this one waits on the network
+        let router = self.router.clone();
+        let result = py.allow_threads(|| runtime().block_on(route_request(router, request)))?;
+        let metadata = record_routed(&result, &self.cache, cache_key, &self.prewarm);
+        build_response(py, result, metadata)
     }
     
     /// Create a chat completion (async version for Python asyncio)
-    /// This returns a coroutine that can be awaited in Python
-    #[pyo3(signature = (model, messages, temperature=None, max_tokens=None))]
+    ///
+    /// Returns an awaitable driven by the shared tokio runtime, so many
+    /// requests can be in flight at once without blocking the event loop.
+    #[pyo3(signature = (model, messages, temperature=None, max_tokens=None, enable_cache=false, seed=None))]
     fn create_async<'py>(
         &self,
         py: Python<'py>,
         model: String,
-        messages: Vec<Py<Message>>,
+        messages: Vec<Bound<'py, PyAny>>,
         temperature: Option<f32>,
         max_tokens: Option<u32>,
-    ) -> PyResult<Py<PyAny>> {
-        // For MVP, wrap the sync version
-        // In production, we'd use pyo3-asyncio for proper async support
-        let result = self.create(py, model, messages, temperature, max_tokens)?;
-        Ok(Py::new(py, result)?.into_any())
+        enable_cache: bool,
+        seed: Option<i64>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let request = self.build_request(&model, &messages, temperature, max_tokens, seed)?;
+        let cache_key = self.cache_key(&request, enable_cache);
+        let cached = cache_key.and_then(|key| self.cache.lookup(key));
+        let router = self.router.clone();
+        let prewarm = self.prewarm.clone();
+        let cache = self.cache.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            if let Some(result) = cached {
+                let metadata = cached_metadata(&result);
+                return Python::with_gil(|py| build_response(py, result, metadata));
+            }
+            
+            let result = route_request(router, request).await?;
+            let metadata = record_routed(&result, &cache, cache_key, &prewarm);
+            Python::with_gil(|py| build_response(py, result, metadata))
+        })
+    }
+}
+
+/// Async chat completions API, where `create` returns an awaitable
+#[pyclass(module = "specado")]
+struct AsyncChatCompletions {
+    inner: Py<ChatCompletions>,
+}
+
+#[pymethods]
+impl AsyncChatCompletions {
+    /// Create a chat completion; await the result
+    #[pyo3(signature = (model, messages, temperature=None, max_tokens=None, enable_cache=false, seed=None))]
+    fn create<'py>(
+        &self,
+        py: Python<'py>,
+        model: String,
+        messages: Vec<Bound<'py, PyAny>>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        enable_cache: bool,
+        seed: Option<i64>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        self.inner.borrow(py).create_async(
+            py,
+            model,
+            messages,
+            temperature,
+            max_tokens,
+            enable_cache,
+            seed,
+        )
+    }
+}
+
+/// Async chat API namespace
+#[pyclass(module = "specado")]
+struct AsyncChat {
+    #[pyo3(get)]
+    completions: Py<AsyncChatCompletions>,
+}
+
+#[pymethods]
+impl AsyncChat {
+    fn __repr__(&self) -> String {
+        "AsyncChat(completions=<AsyncChatCompletions>)".to_string()
     }
 }
 
@@ -329,7 +660,11 @@ impl Chat {
 pub struct Client {
     #[pyo3(get)]
     chat: Py<Chat>,
+    #[pyo3(get)]
+    cache: Py<ResponseCache>,
     config: HashMap<String, Value>,
+    closed: Arc<AtomicBool>,
+    latency: Arc<LatencyTracker>,
 }
 
 #[pymethods]
@@ -372,12 +707,39 @@ impl Client {
             .unwrap_or("anthropic");
         
         // Build router
-        let router = create_router(primary_provider, fallback_provider)?;
-        let router_arc = Arc::new(Mutex::new(router));
+        let retry_policy = retry_policy_from_config(&config_map)?;
+        let latency = Arc::new(latency_tracker_from_config(&config_map));
+        let router = create_router(
+            primary_provider,
+            fallback_provider,
+            retry_policy,
+            latency.clone(),
+        )?;
+        let router: SharedRouter = Arc::from(router);
+        
+        let closed = Arc::new(AtomicBool::new(false));
+        let cache = response_cache_from_config(&config_map)?;
+        
+        // Warm up connections to the configured providers unless disabled
+        let prewarm = Arc::new(Prewarm::default());
+        if config_map.get("prewarm").and_then(Value::as_bool) != Some(false) {
+            let mut names = vec![primary_provider];
+            if fallback_provider != primary_provider {
+                names.push(fallback_provider);
+            }
+            let providers = names
+                .into_iter()
+                .map(provider_for_name)
+                .collect::<PyResult<Vec<_>>>()?;
+            spawn_prewarm(providers, prewarm.clone());
+        }
         
         // Create completions API
         let completions = Py::new(py, ChatCompletions {
-            router: router_arc.clone(),
+            router,
+            closed: closed.clone(),
+            prewarm,
+            cache: cache.clone(),
         })?;
         
         // Create chat namespace
@@ -385,22 +747,66 @@ impl Client {
         
         Ok(Self {
             chat,
+            cache: Py::new(py, cache)?,
             config: config_map,
+            closed,
+            latency,
         })
     }
     
+    fn __enter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+    
+    #[pyo3(signature = (_exc_type=None, _exc_value=None, _traceback=None))]
+    fn __exit__(
+        &self,
+        _exc_type: Option<PyObject>,
+        _exc_value: Option<PyObject>,
+        _traceback: Option<PyObject>,
+    ) -> bool {
+        self.close();
+        false
+    }
+    
+    /// Close the client; further requests raise RuntimeError
+    ///
+    /// Connections live in a process-wide pool shared by all clients and
+    /// are released by its idle timeout rather than per client.
+    fn close(&self) {
+        self.closed.store(true, Ordering::Release);
+    }
+    
+    /// Whether close() has been called
+    #[getter]
+    fn closed(&self) -> bool {
+        self.closed.load(Ordering::Acquire)
+    }
+    
     fn __repr__(&self) -> String {
-        format!("Client(providers={})", 
-            self.config.len()
-        )
+        let mut repr = String::with_capacity(24);
+        let _ = write!(repr, "Client(providers={})", self.config.len());
+        repr
     }
     
     fn __str__(&self) -> String {
-        format!("Specado Client with {} configured providers", self.config.len())
+        let mut text = String::with_capacity(48);
+        let _ = write!(
+            text,
+            "Specado Client with {} configured providers",
+            self.config.len()
+        );
+        text
     }
     
     /// Get configuration value
+    ///
+    /// The special key `latency_stats` returns the observed per-provider
+    /// latency statistics as a JSON string.
     fn get_config(&self, key: &str) -> Option<String> {
+        if key == "latency_stats" {
+            return serde_json::to_string(&self.latency.snapshot()).ok();
+        }
         self.config.get(key).and_then(|v| v.as_str()).map(|s| s.to_string())
     }
     
@@ -410,23 +816,151 @@ impl Client {
     }
 }
 
-/// Helper function to create router
-fn create_router(primary: &str, fallback: &str) -> PyResult<Box<dyn RoutingStrategy>> {
-    let primary_provider: Box<dyn Provider> = match primary {
-        "openai" => Box::new(OpenAIProvider::new()),
-        "anthropic" => Box::new(AnthropicProvider::new()),
-        _ => return Err(PyRuntimeError::new_err(format!("Unknown provider: {}", primary))),
-    };
+/// Specado client for asyncio code
+///
+/// Takes the same configuration as `Client`; `chat.completions.create()`
+/// returns an awaitable instead of blocking.
+#[pyclass(module = "specado")]
+pub struct AsyncClient {
+    #[pyo3(get)]
+    chat: Py<AsyncChat>,
+    inner: Py<Client>,
+}
+
+#[pymethods]
+impl AsyncClient {
+    #[new]
+    #[pyo3(signature = (config=None))]
+    fn new(py: Python, config: Option<&Bound<'_, PyDict>>) -> PyResult<Self> {
+        let client = Client::new(py, config)?;
+        let completions = client.chat.borrow(py).completions.clone_ref(py);
+        let completions = Py::new(py, AsyncChatCompletions { inner: completions })?;
+        let chat = Py::new(py, AsyncChat { completions })?;
+        
+        Ok(Self {
+            chat,
+            inner: Py::new(py, client)?,
+        })
+    }
     
-    let fallback_provider: Box<dyn Provider> = match fallback {
-        "openai" => Box::new(OpenAIProvider::new()),
-        "anthropic" => Box::new(AnthropicProvider::new()),
-        _ => return Err(PyRuntimeError::new_err(format!("Unknown provider: {}", fallback))),
-    };
+    fn __repr__(&self, py: Python) -> String {
+        let mut repr = String::with_capacity(29);
+        let _ = write!(
+            repr,
+            "AsyncClient(providers={})",
+            self.inner.borrow(py).config.len()
+        );
+        repr
+    }
+    
+    /// Get configuration value
+    fn get_config(&self, py: Python, key: &str) -> Option<String> {
+        self.inner.borrow(py).get_config(key)
+    }
+    
+    /// Get all configuration keys
+    fn config_keys(&self, py: Python) -> Vec<String> {
+        self.inner.borrow(py).config_keys()
+    }
+    
+    /// Close the client; further requests raise RuntimeError
+    fn close(&self, py: Python) {
+        self.inner.borrow(py).close();
+    }
+    
+    /// Response cache shared with the underlying client
+    #[getter]
+    fn cache(&self, py: Python) -> Py<ResponseCache> {
+        self.inner.borrow(py).cache.clone_ref(py)
+    }
+    
+    /// Whether close() has been called
+    #[getter]
+    fn closed(&self, py: Python) -> bool {
+        self.inner.borrow(py).closed()
+    }
+}
+
+/// Build a retry policy from the `retry.*` configuration keys
+///
+/// Supported keys: `retry.base_ms`, `retry.multiplier`, `retry.max_ms` and
+/// `retry.jitter` (set to `False` for deterministic delays).
+fn retry_policy_from_config(config: &HashMap<String, Value>) -> PyResult<RetryPolicy> {
+    let mut policy = RetryPolicy::default();
+    
+    if let Some(base_ms) = config.get("retry.base_ms").and_then(Value::as_u64) {
+        policy.initial_delay_ms = base_ms;
+    }
+    if let Some(multiplier) = config.get("retry.multiplier").and_then(Value::as_f64) {
+        if multiplier < 1.0 {
+            return Err(SpecadoError::ConfigurationError(format!(
+                "retry.multiplier must be >= 1.0, got {}",
+                multiplier
+            ))
+            .into());
+        }
+        policy.exponential_base = multiplier;
+    }
+    if let Some(max_ms) = config.get("retry.max_ms").and_then(Value::as_u64) {
+        policy.max_delay_ms = max_ms;
+    }
+    if let Some(false) = config.get("retry.jitter").and_then(Value::as_bool) {
+        policy.jitter_factor = 0.0;
+    }
+    
+    Ok(policy)
+}
+
+/// Build a latency tracker from the `timeout.min_ms` / `timeout.max_ms` keys
+fn latency_tracker_from_config(config: &HashMap<String, Value>) -> LatencyTracker {
+    let min_timeout = config
+        .get("timeout.min_ms")
+        .and_then(Value::as_u64)
+        .map_or(DEFAULT_MIN_TIMEOUT, Duration::from_millis);
+    let max_timeout = config
+        .get("timeout.max_ms")
+        .and_then(Value::as_u64)
+        .map_or(DEFAULT_MAX_TIMEOUT, Duration::from_millis);
+    LatencyTracker::with_bounds(min_timeout, max_timeout)
+}
+
+/// Build the response cache from the `cache.capacity` key
+fn response_cache_from_config(config: &HashMap<String, Value>) -> PyResult<ResponseCache> {
+    let capacity = config
+        .get("cache.capacity")
+        .and_then(Value::as_u64)
+        .map_or(cache::DEFAULT_CAPACITY, |capacity| capacity as usize);
+    let capacity = NonZeroUsize::new(capacity).ok_or_else(|| {
+        SpecadoError::ConfigurationError("cache.capacity must be at least 1".to_string())
+    })?;
+    Ok(ResponseCache::new(capacity))
+}
+
+/// Instantiate a provider by name
+fn provider_for_name(name: &str) -> PyResult<Box<dyn Provider>> {
+    match name {
+        "openai" => Ok(Box::new(OpenAIProvider::new())),
+        "anthropic" => Ok(Box::new(AnthropicProvider::new())),
+        _ => Err(PyRuntimeError::new_err(format!("Unknown provider: {}", name))),
+    }
+}
+
+/// Helper function to create router
+fn create_router(
+    primary: &str,
+    fallback: &str,
+    retry_policy: RetryPolicy,
+    latency: Arc<LatencyTracker>,
+) -> PyResult<Box<dyn RoutingStrategy>> {
+    let primary_provider = provider_for_name(primary)?;
+    let fallback_provider = provider_for_name(fallback)?;
     
     RoutingBuilder::new()
         .primary(primary_provider)
         .fallback(fallback_provider)
+        .retry_policy(retry_policy)
+        .latency_tracker(latency)
+        .http_client(HttpClient::shared().map_err(PyRuntimeError::new_err)?)
         .build()
         .map(|router| Box::new(router) as Box<dyn RoutingStrategy>)
         .map_err(|e| PyRuntimeError::new_err(format!("Failed to build router: {}", e)))
@@ -448,7 +982,12 @@ fn version() -> PyResult<&'static str> {
     Ok(specado_core::version())
 }
 
+mod cache;
 mod capabilities;
+mod metadata;
+
+use cache::ResponseCache;
+use metadata::RoutingMetadata;
 
 /// Main module initialization for Python bindings.
 #[pymodule]
@@ -460,11 +999,18 @@ fn specado(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Add classes
     m.add_class::<Client>()?;
     m.add_class::<Message>()?;
+    m.add_class::<Role>()?;
     m.add_class::<ChatCompletionResponse>()?;
     m.add_class::<Extensions>()?;
+    m.add_class::<RoutingMetadata>()?;
+    m.add_class::<ResponseCache>()?;
     m.add_class::<Choice>()?;
+    m.add_class::<LazyChoices>()?;
     m.add_class::<Chat>()?;
     m.add_class::<ChatCompletions>()?;
+    m.add_class::<AsyncClient>()?;
+    m.add_class::<AsyncChat>()?;
+    m.add_class::<AsyncChatCompletions>()?;
     
     // Add capability functions
     capabilities::register_capabilities(m)?;
@@ -479,8 +1025,9 @@ mod tests {
     #[test]
     fn test_message_creation() {
         Python::with_gil(|py| {
-            let msg = Message::new("user".to_string(), "Hello".to_string());
-            assert_eq!(msg.role, "user");
+            let msg = Message::new(Role::User, "Hello".to_string());
+            assert_eq!(msg.role, Role::User);
+            assert_eq!(msg.role_name(py).to_str().unwrap(), "user");
             assert_eq!(msg.content, "Hello");
         });
     }
@@ -495,23 +1042,35 @@ mod tests {
     
     #[test]
     fn test_message_repr() {
-        let msg = Message::new("assistant".to_string(), "Hi there!".to_string());
+        let msg = Message::new(Role::Assistant, "Hi there!".to_string());
         let repr = msg.__repr__();
         assert!(repr.contains("assistant"));
         assert!(repr.contains("Hi there!"));
     }
     
+    #[test]
+    fn test_role_parse() {
+        assert_eq!(Role::parse("system").unwrap(), Role::System);
+        assert_eq!(Role::parse("tool").unwrap().as_str(), "tool");
+        assert!(matches!(
+            MessageRole::from(Role::Assistant),
+            MessageRole::Assistant
+        ));
+    }
+    
     #[test]
     fn test_extensions_repr() {
-        let ext = Extensions {
-            provider_used: "openai".to_string(),
-            fallback_triggered: false,
-            attempts: 1,
-            metadata_internal: HashMap::new(),
-        };
-        let repr = ext.__repr__();
-        assert!(repr.contains("openai"));
-        assert!(repr.contains("false"));
-        assert!(repr.contains("1"));
+        Python::with_gil(|py| {
+            let ext = Extensions {
+                provider_used: "openai".to_string(),
+                fallback_triggered: false,
+                attempts: 1,
+                metadata: Py::new(py, RoutingMetadata::default()).unwrap(),
+            };
+            let repr = ext.__repr__();
+            assert!(repr.contains("openai"));
+            assert!(repr.contains("false"));
+            assert!(repr.contains("1"));
+        });
     }
 }
\ No newline at end of file
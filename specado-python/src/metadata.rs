@@ -0,0 +1,213 @@
+//! Python bindings for routing metadata
+
+use pyo3::exceptions::PyKeyError;
+use pyo3::prelude::*;
+use pyo3::types::{PyIterator, PyList};
+use pyo3::IntoPyObjectExt;
+use specado_core::providers::RoutingMetadata as CoreRoutingMetadata;
+use std::collections::HashMap;
+use std::fmt::Write;
+
+/// Keys exposed through the mapping interface, in display order
+const KEYS: [&str; 13] = [
+    "primary_provider",
+    "fallback_provider",
+    "fallback_used",
+    "fallback_index",
+    "attempts",
+    "provider_errors",
+    "retry_delay_ms",
+    "retry_delays_ms",
+    "timeout_used_ms",
+    "transformation_lossy",
+    "lossy_reasons",
+    "prewarm_latency_ms",
+    "cache_hit",
+];
+
+/// Routing metadata with a fixed set of typed fields
+///
+/// Fields that were not recorded for a response are `None`. The mapping
+/// methods (`[]`, `in`, `get`, `keys`, `items`) only see recorded fields, so
+/// code written against the previous dict-based metadata keeps working.
+#[pyclass(module = "specado")]
+#[derive(Clone, Debug, Default)]
+pub struct RoutingMetadata {
+    #[pyo3(get)]
+    pub primary_provider: Option<String>,
+    #[pyo3(get)]
+    pub fallback_provider: Option<String>,
+    #[pyo3(get)]
+    pub fallback_used: Option<bool>,
+    #[pyo3(get)]
+    pub fallback_index: Option<usize>,
+    #[pyo3(get)]
+    pub attempts: Option<usize>,
+    #[pyo3(get)]
+    pub provider_errors: Option<HashMap<String, String>>,
+    #[pyo3(get)]
+    pub retry_delay_ms: Option<u64>,
+    #[pyo3(get)]
+    pub retry_delays_ms: Option<HashMap<String, Vec<u64>>>,
+    #[pyo3(get)]
+    pub timeout_used_ms: Option<u64>,
+    #[pyo3(get)]
+    pub transformation_lossy: Option<bool>,
+    #[pyo3(get)]
+    pub lossy_reasons: Option<Vec<String>>,
+    #[pyo3(get)]
+    pub prewarm_latency_ms: Option<u64>,
+    #[pyo3(get)]
+    pub cache_hit: Option<bool>,
+}
+
+impl RoutingMetadata {
+    /// Build from the core router's metadata
+    ///
+    /// `prewarm_latency_ms` and `cache_hit` are filled in by the client.
+    pub fn from_core(core: &CoreRoutingMetadata) -> Self {
+        Self {
+            primary_provider: core.primary_provider.clone(),
+            fallback_provider: core.fallback_provider.clone(),
+            fallback_used: core.fallback_used,
+            fallback_index: core.fallback_index,
+            attempts: core.attempts,
+            provider_errors: core.provider_errors.clone(),
+            retry_delay_ms: core.retry_delay_ms,
+            retry_delays_ms: core.retry_delays_ms.clone(),
+            timeout_used_ms: core.timeout_used_ms,
+            transformation_lossy: core.transformation_lossy,
+            lossy_reasons: core.lossy_reasons.clone(),
+            prewarm_latency_ms: None,
+            cache_hit: None,
+        }
+    }
+
+    /// Look up a recorded field by key
+    fn field(&self, py: Python, key: &str) -> PyResult<Option<PyObject>> {
+        fn convert<'py, T>(py: Python<'py>, value: &Option<T>) -> PyResult<Option<PyObject>>
+        where
+            T: IntoPyObject<'py> + Clone,
+        {
+            value.clone().map(|v| v.into_py_any(py)).transpose()
+        }
+
+        match key {
+            "primary_provider" => convert(py, &self.primary_provider),
+            "fallback_provider" => convert(py, &self.fallback_provider),
+            "fallback_used" => convert(py, &self.fallback_used),
+            "fallback_index" => convert(py, &self.fallback_index),
+            "attempts" => convert(py, &self.attempts),
+            "provider_errors" => convert(py, &self.provider_errors),
+            "retry_delay_ms" => convert(py, &self.retry_delay_ms),
+            "retry_delays_ms" => convert(py, &self.retry_delays_ms),
+            "timeout_used_ms" => convert(py, &self.timeout_used_ms),
+            "transformation_lossy" => convert(py, &self.transformation_lossy),
+            "lossy_reasons" => convert(py, &self.lossy_reasons),
+            "prewarm_latency_ms" => convert(py, &self.prewarm_latency_ms),
+            "cache_hit" => convert(py, &self.cache_hit),
+            _ => Ok(None),
+        }
+    }
+
+    /// Recorded (key, value) pairs in display order
+    fn recorded(&self, py: Python) -> PyResult<Vec<(&'static str, PyObject)>> {
+        let mut items = Vec::with_capacity(KEYS.len());
+        for key in KEYS {
+            if let Some(value) = self.field(py, key)? {
+                items.push((key, value));
+            }
+        }
+        Ok(items)
+    }
+}
+
+#[pymethods]
+impl RoutingMetadata {
+    fn __getitem__(&self, py: Python, key: &str) -> PyResult<PyObject> {
+        self.field(py, key)?
+            .ok_or_else(|| PyKeyError::new_err(key.to_string()))
+    }
+
+    fn __contains__(&self, py: Python, key: &str) -> PyResult<bool> {
+        Ok(self.field(py, key)?.is_some())
+    }
+
+    fn __len__(&self, py: Python) -> PyResult<usize> {
+        Ok(self.recorded(py)?.len())
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        PyList::new(py, self.keys(py)?)?.as_any().try_iter()
+    }
+
+    /// Get a recorded field, or `default` if it was not recorded
+    #[pyo3(signature = (key, default=None))]
+    fn get(&self, py: Python, key: &str, default: Option<PyObject>) -> PyResult<Option<PyObject>> {
+        Ok(self.field(py, key)?.or(default))
+    }
+
+    /// Keys of the recorded fields
+    fn keys(&self, py: Python) -> PyResult<Vec<&'static str>> {
+        Ok(self.recorded(py)?.into_iter().map(|(key, _)| key).collect())
+    }
+
+    /// Values of the recorded fields
+    fn values(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        Ok(self
+            .recorded(py)?
+            .into_iter()
+            .map(|(_, value)| value)
+            .collect())
+    }
+
+    /// (key, value) pairs of the recorded fields
+    fn items(&self, py: Python) -> PyResult<Vec<(&'static str, PyObject)>> {
+        self.recorded(py)
+    }
+
+    fn __repr__(&self, py: Python) -> PyResult<String> {
+        let mut repr = String::with_capacity(256);
+        repr.push_str("RoutingMetadata(");
+        for (i, (key, value)) in self.recorded(py)?.into_iter().enumerate() {
+            if i > 0 {
+                repr.push_str(", ");
+            }
+            let _ = write!(repr, "{}={}", key, value.bind(py).repr()?);
+        }
+        repr.push(')');
+        Ok(repr)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_from_core() {
+        let core = CoreRoutingMetadata {
+            primary_provider: Some("openai".to_string()),
+            fallback_used: Some(true),
+            fallback_index: Some(0),
+            retry_delays_ms: Some(HashMap::from([("openai".to_string(), vec![100, 200])])),
+            provider_errors: Some(HashMap::from([(
+                "openai".to_string(),
+                "Request timeout".to_string(),
+            )])),
+            ..Default::default()
+        };
+
+        let metadata = RoutingMetadata::from_core(&core);
+        assert_eq!(metadata.primary_provider.as_deref(), Some("openai"));
+        assert_eq!(metadata.fallback_used, Some(true));
+        assert_eq!(metadata.fallback_index, Some(0));
+        assert_eq!(metadata.retry_delays_ms.unwrap()["openai"], vec![100, 200]);
+        assert_eq!(
+            metadata.provider_errors.unwrap()["openai"],
+            "Request timeout"
+        );
+        assert!(metadata.fallback_provider.is_none());
+        assert!(metadata.cache_hit.is_none());
+    }
+}
@@ -2,6 +2,8 @@
 """Test script for capability taxonomy in Python"""
 
 import json
+
+import pytest
 import specado
 
 def test_capabilities():
@@ -175,7 +177,44 @@ def test_capabilities():
     print(f"     - Details: {len(comparison2['lossiness_report']['details'])} issues found")
     
     print("\n✅ All capability tests passed!")
-    
+
+
+def test_manifest_cached():
+    """Test that provider manifests are memoized and read-only"""
+    first = specado.get_openai_manifest()
+    assert first is specado.get_openai_manifest()
+    assert first["info"]["name"]
+
+    with pytest.raises(TypeError):
+        first["info"] = {}
+
+
+def test_manifest_lazy_decode():
+    """Test that manifests decode their JSON on first access only"""
+    manifest = specado.Manifest('{"info": {"name": "test"}, "models": {}}')
+    assert manifest._parsed is None
+    assert manifest["info"]["name"] == "test"
+    assert manifest._parsed is not None
+    assert set(manifest) == {"info", "models"}
+
+    with pytest.raises(TypeError):
+        manifest["info"]["name"] = "changed"
+    assert json.loads(specado.get_openai_manifest().json())["info"]["name"]
+
+
+def test_model_capabilities_cached():
+    """Test that model capabilities are memoized and deeply read-only"""
+    caps = specado.get_model_capabilities("openai", "gpt-4-turbo")
+    assert caps is specado.get_model_capabilities("openai", "gpt-4-turbo")
+
+    with pytest.raises(TypeError):
+        caps["features"]["vision"] = False
+    with pytest.raises(TypeError):
+        caps["modalities"]["input"].append("Audio")
+
+    assert json.loads(json.dumps(caps)) == caps
+
+
 if __name__ == "__main__":
     try:
         test_capabilities()
@@ -90,7 +90,7 @@ def test_message_creation():
 def test_chat_completion():
     """Test chat completion (mock)"""
     try:
-        from specado import Client, Message
+        from specado import Client, Message, RoutingMetadata
         
         client = Client()
         messages = [
@@ -123,7 +123,8 @@ def test_chat_completion():
         
         # Check metadata
         metadata = ext.metadata
-        assert isinstance(metadata, dict)
+        assert isinstance(metadata, RoutingMetadata)
+        assert 'primary_provider' in metadata
         print(f"✅ Metadata type: {type(metadata)}")
         
         # Check repr methods
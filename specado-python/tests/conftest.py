@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the Specado Python binding tests
+"""
+import pytest
+from specado import Client
+
+CLIENT_CONFIG = {
+    'primary_provider': 'openai',
+    'fallback_provider': 'anthropic',
+    # No background warm-up, so response metadata does not depend on timing
+    'prewarm': False,
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Client shared by every test in the session (and xdist worker)"""
+    return Client(dict(CLIENT_CONFIG))
+
+
+@pytest.fixture
+def fresh_client():
+    """Client for tests that close it or depend on its cache/config state"""
+    return Client(dict(CLIENT_CONFIG))
@@ -3,7 +3,7 @@ Tests for Specado Python bindings Week 2 functionality
 """
 import pytest
 import specado
-from specado import Client, Message
+from specado import Client, Message, Role
 
 
 def test_client_creation():
@@ -14,17 +14,31 @@ def test_client_creation():
     assert hasattr(client.chat, 'completions')
 
 
-def test_client_with_config():
+def test_client_with_config(fresh_client):
     """Test creating a client with custom configuration"""
-    config = {
-        'primary_provider': 'openai',
-        'fallback_provider': 'anthropic'
-    }
-    client = Client(config)
+    client = fresh_client
     assert client.get_config('primary_provider') == 'openai'
     assert client.get_config('fallback_provider') == 'anthropic'
 
 
+def test_import_defers_native_module():
+    """Test that importing specado does not load the compiled extension"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, specado; "
+        "assert 'specado.specado' not in sys.modules; "
+        "assert isinstance(specado.__version__, str); "
+        "specado.Client; "
+        "assert 'specado.specado' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    assert "importlib" not in dir(specado)
+    assert "ResponseCache" in dir(specado)
+
+
 def test_message_creation():
     """Test creating message objects"""
     msg = Message('user', 'Hello, world!')
@@ -37,10 +51,8 @@ def test_message_creation():
     assert 'user' in repr_str
 
 
-def test_chat_completion_basic():
+def test_chat_completion_basic(client):
     """Test basic chat completion request"""
-    client = Client()
-    
     messages = [
         Message('system', 'You are a helpful assistant'),
         Message('user', 'Hello')
@@ -64,10 +76,40 @@ def test_chat_completion_basic():
     assert hasattr(response.extensions, 'metadata')
 
 
-def test_chat_completion_with_params():
-    """Test chat completion with temperature and max_tokens"""
-    client = Client()
+def test_chat_completion_cache_hit(fresh_client):
+    """Test that an identical deterministic request is served from the cache"""
+    client = fresh_client
+    messages = [Message('user', 'Hello')]
+    
+    first = client.chat.completions.create(
+        model='gpt-4', messages=messages, temperature=0.0, enable_cache=True
+    )
+    second = client.chat.completions.create(
+        model='gpt-4', messages=messages, temperature=0.0, enable_cache=True
+    )
+    
+    assert first.extensions.metadata.cache_hit is False
+    assert second.extensions.metadata.cache_hit is True
+    assert second.id == first.id
+    assert isinstance(client.cache, specado.ResponseCache)
+    assert client.cache.hits == 1
+    assert len(client.cache) == 1
+
+
+def test_chat_completion_cache_skips_sampling(fresh_client):
+    """Test that non-deterministic requests bypass the cache"""
+    client = fresh_client
     
+    response = client.chat.completions.create(
+        model='gpt-4', messages=[('user', 'Hello')], temperature=0.7, enable_cache=True
+    )
+    
+    assert response.extensions.metadata.cache_hit is None
+    assert len(client.cache) == 0
+
+
+def test_chat_completion_with_params(client):
+    """Test chat completion with temperature and max_tokens"""
     messages = [
         Message('user', 'Tell me a story')
     ]
@@ -90,13 +132,25 @@ def test_chat_completion_with_params():
     assert choice.message.role == 'assistant'
 
 
-def test_fallback_triggered():
-    """Test that fallback is triggered on primary failure"""
-    client = Client({
-        'primary_provider': 'openai',
-        'fallback_provider': 'anthropic'
-    })
+def test_choices_lazy_sequence(client):
+    """Test that choices behave like a sequence and are built once"""
+    response = client.chat.completions.create(
+        model='gpt-4',
+        messages=[Message('user', 'Hello')]
+    )
     
+    choices = response.choices
+    assert choices[0] is choices[0]
+    assert choices[-1] is choices[len(choices) - 1]
+    assert list(choices)[0] is choices[0]
+    with pytest.raises(IndexError):
+        choices[len(choices)]
+    assert choices[:1] == [choices[0]]
+    assert choices[::-1][-1] is choices[0]
+
+
+def test_fallback_triggered(client):
+    """Test that fallback is triggered on primary failure"""
     # Use special model that triggers timeout in demo implementation
     messages = [Message('user', 'Test fallback')]
     
@@ -111,10 +165,8 @@ def test_fallback_triggered():
     assert response.extensions.attempts > 1
 
 
-def test_rate_limit_handling():
+def test_rate_limit_handling(client):
     """Test rate limit error handling"""
-    client = Client()
-    
     messages = [Message('user', 'Test rate limit')]
     
     response = client.chat.completions.create(
@@ -127,10 +179,8 @@ def test_rate_limit_handling():
     assert response.extensions.provider_used == 'anthropic'
 
 
-def test_metadata_tracking():
+def test_metadata_tracking(client):
     """Test that routing metadata is properly tracked"""
-    client = Client()
-    
     messages = [Message('user', 'Test metadata')]
     
     response = client.chat.completions.create(
@@ -143,16 +193,16 @@ def test_metadata_tracking():
     assert 'primary_provider' in metadata
     assert 'fallback_used' in metadata
     assert metadata['fallback_used'] == False
+    assert metadata.timeout_used_ms > 0
+    assert response.extensions.metadata is metadata
     
     # Primary should succeed
     assert response.extensions.provider_used == 'openai'
     assert response.extensions.fallback_triggered == False
 
 
-def test_auth_error_non_retryable():
+def test_auth_error_non_retryable(client):
     """Test that auth errors are not retried"""
-    client = Client()
-    
     messages = [Message('user', 'Test auth error')]
     
     with pytest.raises(RuntimeError) as exc_info:
@@ -179,10 +229,8 @@ def test_module_version():
     assert isinstance(specado.__version__, str)
 
 
-def test_multiple_messages():
+def test_multiple_messages(client):
     """Test chat completion with multiple messages"""
-    client = Client()
-    
     messages = [
         Message('system', 'You are a helpful assistant'),
         Message('user', 'Hello'),
@@ -200,22 +248,15 @@ def test_multiple_messages():
     assert response.extensions.attempts >= 1
 
 
-def test_client_repr():
+def test_client_repr(client):
     """Test client string representation"""
-    config = {
-        'primary_provider': 'openai',
-        'fallback_provider': 'anthropic'
-    }
-    client = Client(config)
     repr_str = repr(client)
     assert 'Client' in repr_str
     assert 'providers' in repr_str
 
 
-def test_response_repr():
+def test_response_repr(client):
     """Test response string representation"""
-    client = Client()
-    
     messages = [Message('user', 'Test')]
     response = client.chat.completions.create(
         model='gpt-4',
@@ -228,10 +269,8 @@ def test_response_repr():
     assert 'openai' in repr_str
 
 
-def test_server_error_fallback():
+def test_server_error_fallback(client):
     """Test that server errors trigger fallback"""
-    client = Client()
-    
     messages = [Message('user', 'Test server error')]
     
     response = client.chat.completions.create(
@@ -242,4 +281,159 @@ def test_server_error_fallback():
     # Should fall back to anthropic
     assert response.extensions.fallback_triggered == True
     assert response.extensions.provider_used == 'anthropic'
-    assert response.extensions.attempts > 1
\ No newline at end of file
+    assert response.extensions.attempts > 1
+
+
+def test_default_client_shared():
+    """Test that default_client returns a single shared instance"""
+    client = specado.default_client()
+    assert client is specado.default_client()
+
+    client.close()
+    replacement = specado.default_client()
+    assert replacement is not client
+    assert not replacement.closed
+
+
+def test_client_context_manager(fresh_client):
+    """Test that a closed client rejects further requests"""
+    with fresh_client as client:
+        assert not client.closed
+
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client.chat.completions.create(
+            model='gpt-4',
+            messages=[Message('user', 'Hello')]
+        )
+
+
+def test_message_many():
+    """Test batch creation of messages"""
+    messages = Message.many([('system', 'Be brief'), (Role.User, 'Hello')])
+    assert len(messages) == 2
+    assert messages[0].role == 'system'
+    assert messages[1].role == 'user'
+    assert messages[1].content == 'Hello'
+
+
+def test_message_role_enum():
+    """Test that roles accept Role values and reject unknown names"""
+    msg = Message(Role.Assistant, 'Hi')
+    assert msg.role == 'assistant'
+    assert msg.role == str(Role.Assistant)
+    assert {Role.User: 1}[Role.User] == 1
+
+    msg.role = 'system'
+    assert msg.role == 'system'
+
+    with pytest.raises(ValueError):
+        Message('narrator', 'Once upon a time')
+
+
+def test_chat_completion_with_tuples(client):
+    """Test that (role, content) tuples are accepted as messages"""
+    response = client.chat.completions.create(
+        model='gpt-4',
+        messages=[('system', 'You are a helpful assistant'), ('user', 'Hello')]
+    )
+
+    assert response is not None
+    assert len(response.choices) > 0
+
+
+def test_chat_completion_invalid_message(client):
+    """Test that malformed messages raise TypeError"""
+    with pytest.raises(TypeError):
+        client.chat.completions.create(model='gpt-4', messages=[42])
+
+
+def test_retry_backoff_increasing():
+    """Test that retry delays grow exponentially on transient errors"""
+    client = Client({
+        'retry.base_ms': 10,
+        'retry.multiplier': 2.0,
+        'retry.max_ms': 1000,
+        'retry.jitter': False,
+    })
+
+    messages = [Message('user', 'Test backoff')]
+
+    response = client.chat.completions.create(
+        model='rate-limit-test-model',
+        messages=messages
+    )
+
+    delays = response.extensions.metadata.retry_delays_ms['openai']
+    assert len(delays) > 1
+    assert all(a < b for a, b in zip(delays, delays[1:]))
+
+
+def test_retry_invalid_multiplier():
+    """Test that a shrinking backoff multiplier is rejected"""
+    with pytest.raises(ValueError):
+        Client({'retry.multiplier': 0.5})
+
+
+def test_latency_stats_exposed(client):
+    """Test that observed latency is exposed via get_config"""
+    import json
+
+    client.chat.completions.create(
+        model='gpt-4',
+        messages=[Message('user', 'Hello')]
+    )
+
+    stats = json.loads(client.get_config('latency_stats'))
+    assert stats['openai/gpt-4']['count'] >= 1
+
+
+def test_async_client_concurrent():
+    """Test concurrent chat completions through AsyncClient"""
+    import asyncio
+
+    async def run():
+        client = specado.AsyncClient()
+        return await asyncio.gather(*(
+            client.chat.completions.create(
+                model='gpt-4',
+                messages=[Message('user', f'Question {i}')]
+            )
+            for i in range(3)
+        ))
+
+    responses = asyncio.run(run())
+    assert len(responses) == 3
+    for response in responses:
+        assert len(response.choices) > 0
+        assert response.extensions.attempts >= 1
+
+
+def test_sync_client_threads(client):
+    """Test that one client can serve several Python threads at once"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def ask(i):
+        return client.chat.completions.create(
+            model='gpt-4',
+            messages=[Message('user', f'Question {i}')]
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(ask, range(4)))
+
+    assert len(responses) == 4
+    for response in responses:
+        assert len(response.choices) > 0
+
+
+def test_prewarm_opt_out():
+    """Test that disabling prewarm leaves no warm-up metadata"""
+    client = Client({'prewarm': False})
+
+    response = client.chat.completions.create(
+        model='gpt-4',
+        messages=[Message('user', 'Hello')]
+    )
+
+    assert 'prewarm_latency_ms' not in response.extensions.metadata